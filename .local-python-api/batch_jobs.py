@@ -0,0 +1,206 @@
+"""
+ARCO Intelligence API - Batch job queue
+In-process asyncio worker pool for bulk domain analysis, with per-host politeness
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Job lifecycle
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+CANCELLED = "cancelled"
+
+# Item lifecycle
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class BatchJob:
+    """One submitted batch: the domains, their results and progress counters"""
+
+    def __init__(self, domains: List[str], options: Dict[str, Any]):
+        self.id = uuid.uuid4().hex
+        self.domains = domains
+        self.options = options
+        self.status = QUEUED
+        self.items: List[Dict[str, Any]] = [
+            {"domain": domain, "status": PENDING, "analysis": None} for domain in domains
+        ]
+        self.completed = 0
+        self.failed = 0
+        self.created_at = datetime.utcnow().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self._finished_monotonic: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, CANCELLED)
+
+    def progress(self) -> Dict[str, Any]:
+        """Polling payload"""
+        total = len(self.items)
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "total": total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "pending": total - self.completed - self.failed,
+            "progress": round((self.completed + self.failed) / total, 4) if total else 1.0,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+    def page(self, offset: int, limit: int) -> Dict[str, Any]:
+        """Slice of per-domain results in submission order"""
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "offset": offset,
+            "limit": limit,
+            "total": len(self.items),
+            "results": self.items[offset:offset + limit]
+        }
+
+    def _record(self, index: int, status: str, analysis: Any):
+        item = self.items[index]
+        if item["status"] != PENDING:
+            return
+        item["status"] = status
+        item["analysis"] = analysis
+        if status == DONE:
+            self.completed += 1
+        else:
+            self.failed += 1
+        if self.completed + self.failed == len(self.items) and not self.finished:
+            self._finish(COMPLETED)
+
+    def _finish(self, status: str):
+        self.status = status
+        self.finished_at = datetime.utcnow().isoformat()
+        self._finished_monotonic = time.monotonic()
+
+
+class BatchRunner:
+    """
+    Fixed pool of asyncio workers draining a shared queue of (job, index) items.
+    Worker count bounds concurrency; consecutive analyses of the same host are
+    spaced at least host_interval seconds apart.
+    """
+
+    def __init__(
+        self,
+        analyze: Callable[[str, Dict[str, Any]], Awaitable[Any]],
+        workers: int = 8,
+        host_interval: float = 1.0,
+        job_ttl: float = 3600.0,
+        max_jobs: int = 100,
+        host_key: Callable[[str], str] = lambda domain: domain
+    ):
+        self.analyze = analyze
+        self.workers = workers
+        self.host_interval = host_interval
+        self.job_ttl = job_ttl
+        self.max_jobs = max_jobs
+        self.host_key = host_key
+        self.jobs: Dict[str, BatchJob] = {}
+        self._queue: "asyncio.Queue" = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self._host_next_slot: Dict[str, float] = {}
+
+    def start(self):
+        """Spawn the worker pool (idempotent)"""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Cancel workers; unfinished jobs are left as they are"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, domains: List[str], options: Dict[str, Any]) -> BatchJob:
+        """Register a job; call enqueue() (e.g. from a BackgroundTask) to schedule it"""
+        self._prune()
+        if len(self.jobs) >= self.max_jobs:
+            raise RuntimeError(f"Too many active batch jobs (max {self.max_jobs})")
+        job = BatchJob(domains, options)
+        self.jobs[job.id] = job
+        return job
+
+    def enqueue(self, job: BatchJob):
+        """Put every domain of the job on the worker queue"""
+        self.start()
+        for index in range(len(job.items)):
+            self._queue.put_nowait((job, index))
+
+    def cancel(self, job: BatchJob):
+        """Stop scheduling the job's remaining domains"""
+        if not job.finished:
+            job._finish(CANCELLED)
+
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        return self.jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._tasks),
+            "queued_items": self._queue.qsize(),
+            "jobs": len(self.jobs),
+            "active_jobs": sum(1 for job in self.jobs.values() if not job.finished)
+        }
+
+    async def _worker(self):
+        while True:
+            job, index = await self._queue.get()
+            try:
+                if job.finished:
+                    continue
+                if job.status == QUEUED:
+                    job.status = RUNNING
+                    job.started_at = datetime.utcnow().isoformat()
+
+                domain = job.domains[index]
+                await self._polite(self.host_key(domain))
+                if job.finished:
+                    continue
+                try:
+                    analysis = await self.analyze(domain, job.options)
+                    job._record(index, DONE, analysis)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    job._record(index, FAILED, {"error": str(getattr(e, "detail", e))})
+            finally:
+                self._queue.task_done()
+
+    async def _polite(self, host: str):
+        """Reserve the host's next free slot and sleep until it arrives"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._host_next_slot.get(host, 0.0))
+        self._host_next_slot[host] = slot + self.host_interval
+        if len(self._host_next_slot) > 10000:
+            self._host_next_slot = {h: t for h, t in self._host_next_slot.items() if t > now}
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def _prune(self):
+        """Forget finished jobs older than job_ttl"""
+        cutoff = time.monotonic() - self.job_ttl
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job.finished and job._finished_monotonic is not None and job._finished_monotonic < cutoff
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+ARCO Intelligence API - technical stack check
+
+Serves a sample page whose framework markers are all in <body> (root
+element attributes, scoped-style attributes, <script src> before </body>)
+on a local port, fetches it through _PageSource like a deep analysis does,
+and checks that _analyze_technical_stack reports every technology.
+
+Usage:
+    python .local-python-api/check_tech_stack.py
+"""
+
+import asyncio
+import sys
+
+from aiohttp import web
+
+from main import _PageSource, _analyze_technical_stack
+
+SAMPLE_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>Body markers only</title>
+</head>
+<body>
+  <div id="__next"><div data-reactroot=""><app-root ng-version="17.0.0"><p _ngcontent-abc-c1="">Hello</p></app-root></div></div>
+  <div id="app" data-v-app=""></div>
+  <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
+  <script src="/static/bootstrap.bundle.min.js"></script>
+</body>
+</html>
+"""
+
+EXPECTED = {"Angular", "Bootstrap", "Next.js", "React", "Vue.js", "jQuery"}
+
+
+async def run() -> int:
+    app = web.Application()
+    app.router.add_get("/", lambda request: web.Response(text=SAMPLE_PAGE, content_type="text/html"))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        page = _PageSource(f"http://127.0.0.1:{port}/")
+        result = await _analyze_technical_stack(page.full)
+    finally:
+        await runner.cleanup()
+
+    if "error" in result:
+        print(f"  error: {result['error']}")
+        return 1
+    detected = {tech["name"] for tech in result["technologies"]}
+    missing = EXPECTED - detected
+    print(f"  detected: {sorted(detected)}")
+    if missing:
+        print(f"  !! body-only markers not detected: {sorted(missing)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
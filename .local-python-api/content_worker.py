@@ -0,0 +1,54 @@
+"""
+ARCO Intelligence API - Content worker
+CPU-bound page analysis, run in the CPU pool's worker processes.
+Kept free of app state so it imports cheaply in every worker.
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict
+
+from arco_shared.html_digest import digest_html
+
+try:
+    from textstat import flesch_reading_ease, flesch_kincaid_grade
+    TEXTSTAT_AVAILABLE = True
+except ImportError:
+    TEXTSTAT_AVAILABLE = False
+
+
+def page_profile(html: str) -> Dict[str, Any]:
+    """
+    One parse and one readability pass over a page. Returns only the derived
+    numbers (not the text), so little has to travel back from the worker.
+    """
+    digest = digest_html(html)
+    text = digest.text
+    words = text.split()
+
+    profile = {
+        "title": digest.title,
+        "description": digest.meta.get('description', ""),
+        "headings": digest.headings(),
+        "word_count": len(words),
+        "character_count": len(text),
+        "paragraph_count": digest.count('p'),
+        "image_count": digest.count('img'),
+        "link_count": digest.count('a'),
+        "readability": {},
+        "keyword_density": {},
+    }
+
+    if TEXTSTAT_AVAILABLE and len(words) > 100:
+        profile["readability"] = {
+            "flesch_reading_ease": flesch_reading_ease(text),
+            "flesch_kincaid_grade": flesch_kincaid_grade(text)
+        }
+
+    # Keyword density: top 10 words longer than 3 characters
+    keywords = [word for word in re.findall(r'\w+', text.lower()) if len(word) > 3]
+    if keywords:
+        for keyword, count in Counter(keywords).most_common(10):
+            profile["keyword_density"][keyword] = round(count / len(keywords), 4)
+
+    return profile
@@ -0,0 +1,155 @@
+"""
+ARCO Intelligence API - CPU offload
+Process pool for CPU-bound analysis (with backpressure) and an event loop lag monitor
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+
+class CpuPoolBusy(RuntimeError):
+    """Raised when a job waited longer than max_wait for a free slot"""
+
+
+class CpuPool:
+    """
+    Runs picklable top-level functions in a ProcessPoolExecutor so parsing and
+    scoring never hold the event loop. At most max_pending jobs are submitted at
+    once; further callers wait for a slot (up to max_wait seconds).
+    workers=0 runs jobs inline on the loop, i.e. the old behaviour.
+    """
+
+    def __init__(self, workers: int, max_pending: int, max_wait: float = 30.0):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_wait = max_wait
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._running = 0
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "waited": 0,        # jobs that had to queue for a slot
+            "wait_seconds": 0.0,
+            "pool_restarts": 0,
+        }
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        if self.workers <= 0:
+            return fn(*args)
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        if self._slots.locked():
+            self.stats["waited"] += 1
+
+        started = time.monotonic()
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            self.stats["rejected"] += 1
+            raise CpuPoolBusy(f"CPU pool busy ({self.max_pending} jobs pending)")
+        finally:
+            self._waiting -= 1
+        self.stats["wait_seconds"] += time.monotonic() - started
+
+        self._running += 1
+        self.stats["submitted"] += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._pool(), fn, *args)
+            self.stats["completed"] += 1
+            return result
+        except BrokenProcessPool:
+            # A worker died (OOM, segfault in a C parser); start a fresh pool for later jobs
+            self.stats["failed"] += 1
+            self._reset()
+            raise
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        finally:
+            self._running -= 1
+            self._slots.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "wait_seconds": round(self.stats["wait_seconds"], 3),
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "running": self._running,
+            "waiting": self._waiting,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _reset(self):
+        self.shutdown()
+        self.stats["pool_restarts"] += 1
+
+
+class LoopLagMonitor:
+    """
+    Sleeps interval seconds in a loop and records how late it wakes up.
+    The lateness is the time the loop spent blocked by something else.
+    """
+
+    def __init__(self, interval: float = 0.05, block_threshold: float = 0.1, window: int = 1200):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self._recent: deque = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+        self.samples = 0
+        self.max_lag = 0.0
+        self.blocks = 0
+        self.blocked_seconds = 0.0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = sorted(self._recent)
+        return {
+            "samples": self.samples,
+            "lag_p50_ms": round(recent[len(recent) // 2] * 1000, 2) if recent else None,
+            "lag_p99_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.99))] * 1000, 2) if recent else None,
+            "lag_max_ms": round(self.max_lag * 1000, 2),
+            f"blocks_over_{int(self.block_threshold * 1000)}ms": self.blocks,
+            "blocked_seconds": round(self.blocked_seconds, 3),
+        }
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.samples += 1
+            self._recent.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+            if lag >= self.block_threshold:
+                self.blocks += 1
+                self.blocked_seconds += lag
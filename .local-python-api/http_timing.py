@@ -0,0 +1,164 @@
+"""
+ARCO Intelligence API - HTTP phase timing
+aiohttp trace hooks that split a request into DNS, connect, TTFB and download phases
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+
+class RequestTimings:
+    """
+    Monotonic timestamps for one request (including any redirects).
+    Pass as session.get(url, trace_request_ctx=timings.ctx()).
+    """
+
+    def __init__(self):
+        self.start: Optional[float] = None
+        self.dns = 0.0
+        self.connect = 0.0
+        self.queued = 0.0
+        self.connection_reused = False
+        self.redirects = 0
+        self.bytes = 0
+        self.headers_sent: Optional[float] = None
+        self.headers_received: Optional[float] = None
+        self.end: Optional[float] = None
+        self._phase_start: Dict[str, float] = {}
+        self._dns_before_connect = 0.0
+
+    def ctx(self) -> Dict[str, Any]:
+        return {"timings": self}
+
+    def finish(self):
+        """Body fully read"""
+        self.end = time.perf_counter()
+
+    def phases(self) -> Dict[str, Any]:
+        """Seconds per phase, bytes and transfer rate"""
+        received = self.headers_received or self.end
+        sent = self.headers_sent or self.start
+        ttfb = received - sent if received is not None and sent is not None else None
+        download = self.end - received if self.end is not None and received is not None else None
+        total = self.end - self.start if self.end is not None and self.start is not None else None
+        return {
+            "dns": round(self.dns, 4),
+            # TCP connect and TLS handshake: aiohttp sets up both in one step with no hook in between
+            "connect": round(self.connect, 4),
+            "queued": round(self.queued, 4),
+            "ttfb": round(ttfb, 4) if ttfb is not None else None,
+            "download": round(download, 4) if download is not None else None,
+            "total": round(total, 4) if total is not None else None,
+            "bytes": self.bytes,
+            "transfer_rate": round(self.bytes / download) if download else None,  # bytes/s
+            "connection_reused": self.connection_reused,
+            "redirects": self.redirects,
+        }
+
+    def _begin(self, phase: str):
+        self._phase_start[phase] = time.perf_counter()
+
+    def _elapsed(self, phase: str) -> float:
+        started = self._phase_start.pop(phase, None)
+        return time.perf_counter() - started if started is not None else 0.0
+
+
+def _timings(trace_config_ctx: SimpleNamespace) -> Optional[RequestTimings]:
+    ctx = trace_config_ctx.trace_request_ctx
+    return ctx.get("timings") if isinstance(ctx, dict) else None
+
+
+async def _on_request_start(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None and timings.start is None:
+        timings.start = time.perf_counter()
+
+
+async def _on_request_redirect(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings.redirects += 1
+
+
+async def _on_connection_queued_start(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings._begin("queued")
+
+
+async def _on_connection_queued_end(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings.queued += timings._elapsed("queued")
+
+
+async def _on_dns_resolvehost_start(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings._begin("dns")
+
+
+async def _on_dns_resolvehost_end(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings.dns += timings._elapsed("dns")
+
+
+async def _on_connection_create_start(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings._begin("connect")
+        timings._dns_before_connect = timings.dns
+
+
+async def _on_connection_create_end(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        # DNS resolution happens inside connection creation; count it only once
+        timings.connect += max(0.0, timings._elapsed("connect") - (timings.dns - timings._dns_before_connect))
+
+
+async def _on_connection_reuseconn(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings.connection_reused = True
+
+
+async def _on_request_headers_sent(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings.headers_sent = time.perf_counter()
+
+
+async def _on_request_end(session, trace_config_ctx, params):
+    # Fired once the response headers have arrived
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings.headers_received = time.perf_counter()
+
+
+async def _on_response_chunk_received(session, trace_config_ctx, params):
+    timings = _timings(trace_config_ctx)
+    if timings is not None:
+        timings.bytes += len(params.chunk)
+
+
+def timing_trace_config() -> aiohttp.TraceConfig:
+    """TraceConfig for the shared session; requests without a RequestTimings ctx are untouched"""
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(_on_request_start)
+    trace.on_request_redirect.append(_on_request_redirect)
+    trace.on_connection_queued_start.append(_on_connection_queued_start)
+    trace.on_connection_queued_end.append(_on_connection_queued_end)
+    trace.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace.on_connection_create_start.append(_on_connection_create_start)
+    trace.on_connection_create_end.append(_on_connection_create_end)
+    trace.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace.on_request_headers_sent.append(_on_request_headers_sent)
+    trace.on_request_end.append(_on_request_end)
+    trace.on_response_chunk_received.append(_on_response_chunk_received)
+    return trace
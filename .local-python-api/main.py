@@ -7,15 +7,17 @@ Real-time domain analysis, security auditing, performance optimization
 from fastapi import FastAPI, HTTPException, Depends, Security, BackgroundTasks
 from fastapi.security.api_key import APIKeyHeader
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, HttpUrl
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable
 import asyncio
 import aiohttp
-import ssl
+import codecs
 import socket
 from urllib.parse import urlparse
 import time
 import json
+import re
 from datetime import datetime
 import subprocess
 import hashlib
@@ -23,11 +25,22 @@ import os
 
 # Core dependencies that should always be available
 import requests
-from bs4 import BeautifulSoup
+
+from result_cache import ResultCache
+from batch_jobs import BatchRunner
+from perf_timeseries import PerformanceMonitor, ROLLUPS
+from http_timing import RequestTimings, timing_trace_config
+from cpu_pool import CpuPool, LoopLagMonitor
+from content_worker import page_profile
+from tech_fingerprint import TechFingerprinter, SIGNATURES_PATH
+
+# Shared with the CLI scripts and the intelligence analyzers (pip install -e ../.local-python-scripts)
+from arco_shared.tls_probe import get_tls_probe
 
 # Optional dependencies - import with error handling
 try:
     import dns.resolver
+    from arco_shared.dns_cache import get_resolver
     DNS_AVAILABLE = True
 except ImportError:
     DNS_AVAILABLE = False
@@ -40,6 +53,7 @@ except ImportError:
 
 try:
     import whois
+    from arco_shared.whois_store import get_whois_store
     WHOIS_AVAILABLE = True
 except ImportError:
     WHOIS_AVAILABLE = False
@@ -78,6 +92,79 @@ try:
 except ImportError:
     ML_AVAILABLE = False
 
+# Per-probe timeouts (seconds) - one slow upstream must never hold the worker
+DNS_TIMEOUT = float(os.getenv("ARCO_DNS_TIMEOUT", "5"))
+TLS_TIMEOUT = float(os.getenv("ARCO_TLS_TIMEOUT", "10"))
+WHOIS_TIMEOUT = float(os.getenv("ARCO_WHOIS_TIMEOUT", "15"))
+
+# Outbound HTTP pool shared by every analyzer (created at startup)
+HTTP_TIMEOUT = float(os.getenv("ARCO_HTTP_TIMEOUT", "15"))
+HTTP_POOL_LIMIT = int(os.getenv("ARCO_HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("ARCO_HTTP_POOL_LIMIT_PER_HOST", "8"))
+HTTP_KEEPALIVE = float(os.getenv("ARCO_HTTP_KEEPALIVE", "30"))
+HTTP_DNS_CACHE_TTL = int(os.getenv("ARCO_HTTP_DNS_CACHE_TTL", "300"))
+HTTP_USER_AGENT = "ARCO-Intelligence/1.0 (+https://arco.dev)"
+
+# Page downloads are streamed and cut off at these limits
+HTML_MAX_BYTES = int(os.getenv("ARCO_HTML_MAX_BYTES", str(5 * 1024 * 1024)))
+HTML_MAX_READ_TIME = float(os.getenv("ARCO_HTML_MAX_READ_TIME", "10"))
+HTML_CHUNK_SIZE = 64 * 1024
+
+# Technology signature DB, compiled once at import
+TECH_SIGNATURES = os.getenv("ARCO_TECH_SIGNATURES", SIGNATURES_PATH)
+_tech_fingerprinter = TechFingerprinter.from_file(TECH_SIGNATURES)
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+# Probe result cache - per-probe TTLs, stale entries served while refreshing
+CACHE_MAX_ENTRIES = int(os.getenv("ARCO_CACHE_MAX_ENTRIES", "2048"))
+CACHE_STALE_FACTOR = float(os.getenv("ARCO_CACHE_STALE_FACTOR", "1.0"))
+CACHE_DB_PATH = os.getenv("ARCO_CACHE_DB")  # optional SQLite file, keeps the cache warm across restarts
+TLS_CACHE_TTL = float(os.getenv("ARCO_TLS_CACHE_TTL", str(6 * 3600)))
+HTML_CACHE_TTL = float(os.getenv("ARCO_HTML_CACHE_TTL", "600"))
+DNS_CACHE_TTL_DEFAULT = 300.0  # when no answer carried a TTL
+DNS_CACHE_TTL_MIN = 30.0
+
+_result_cache = ResultCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    stale_factor=CACHE_STALE_FACTOR,
+    db_path=CACHE_DB_PATH
+)
+
+# Competitive intelligence fan-out
+COMPETITOR_CONCURRENCY = int(os.getenv("ARCO_COMPETITOR_CONCURRENCY", "5"))
+COMPETITIVE_DEADLINE = float(os.getenv("ARCO_COMPETITIVE_DEADLINE", "45"))
+
+# Batch analysis job queue
+BATCH_WORKERS = int(os.getenv("ARCO_BATCH_WORKERS", "8"))
+BATCH_MAX_DOMAINS = int(os.getenv("ARCO_BATCH_MAX_DOMAINS", "1000"))
+BATCH_MAX_JOBS = int(os.getenv("ARCO_BATCH_MAX_JOBS", "100"))
+BATCH_HOST_INTERVAL = float(os.getenv("ARCO_BATCH_HOST_INTERVAL", "2"))
+BATCH_JOB_TTL = float(os.getenv("ARCO_BATCH_JOB_TTL", "3600"))
+
+# Performance monitor - watched domains are sampled in the background
+PERF_SAMPLE_INTERVAL = float(os.getenv("ARCO_PERF_SAMPLE_INTERVAL", "60"))
+PERF_CONCURRENCY = int(os.getenv("ARCO_PERF_CONCURRENCY", "4"))
+PERF_MAX_DOMAINS = int(os.getenv("ARCO_PERF_MAX_DOMAINS", "200"))
+PERF_IDLE_TTL = float(os.getenv("ARCO_PERF_IDLE_TTL", str(24 * 3600)))  # stop sampling unqueried domains
+PERF_RAW_SAMPLES = int(os.getenv("ARCO_PERF_RAW_SAMPLES", "1440"))
+PERF_P95_ALERT = float(os.getenv("ARCO_PERF_P95_ALERT", "3.0"))
+PERF_ERROR_RATE_ALERT = float(os.getenv("ARCO_PERF_ERROR_RATE_ALERT", "0.05"))
+
+# CPU-bound analysis (parsing, readability) runs in a process pool; 0 workers = inline on the event loop
+CPU_WORKERS = int(os.getenv("ARCO_CPU_WORKERS", str(min(4, os.cpu_count() or 1))))
+CPU_MAX_PENDING = int(os.getenv("ARCO_CPU_MAX_PENDING", str(max(1, CPU_WORKERS) * 4)))
+CPU_MAX_WAIT = float(os.getenv("ARCO_CPU_MAX_WAIT", "30"))
+
+_cpu_pool = CpuPool(workers=CPU_WORKERS, max_pending=CPU_MAX_PENDING, max_wait=CPU_MAX_WAIT)
+_loop_lag = LoopLagMonitor()
+
+# Per-phase thresholds (seconds) for performance scoring and alerts
+SLOW_DNS = float(os.getenv("ARCO_SLOW_DNS", "0.5"))
+SLOW_CONNECT = float(os.getenv("ARCO_SLOW_CONNECT", "1.0"))
+SLOW_TTFB = float(os.getenv("ARCO_SLOW_TTFB", "1.8"))
+SLOW_DOWNLOAD = float(os.getenv("ARCO_SLOW_DOWNLOAD", "2.0"))
+
 app = FastAPI(
     title="ARCO Intelligence API",
     description="Advanced technical analysis and competitive intelligence",
@@ -93,6 +180,73 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _create_http_session() -> aiohttp.ClientSession:
+    """Pooled keep-alive session with per-host limits, DNS caching and phase timing hooks"""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE,
+        use_dns_cache=True,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        headers={"User-Agent": HTTP_USER_AGENT},
+        trace_configs=[timing_trace_config()]
+    )
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Application-scoped session; created lazily if startup hasn't run (e.g. scripts/tests)"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = _create_http_session()
+    return _http_session
+
+@app.on_event("startup")
+async def _startup_http_session():
+    """Open the shared outbound HTTP pool"""
+    _get_http_session()
+
+@app.on_event("shutdown")
+async def _shutdown_http_session():
+    """Close the shared outbound HTTP pool"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+@app.on_event("startup")
+async def _startup_batch_runner():
+    """Start the batch analysis worker pool"""
+    _batch_runner.start()
+
+@app.on_event("shutdown")
+async def _shutdown_batch_runner():
+    """Stop batch workers (in-flight items are abandoned)"""
+    await _batch_runner.stop()
+
+@app.on_event("shutdown")
+async def _shutdown_performance_monitor():
+    """Stop background performance sampling"""
+    await _performance_monitor.stop()
+
+@app.on_event("startup")
+async def _startup_loop_lag_monitor():
+    """Measure how long the event loop gets blocked"""
+    _loop_lag.start()
+
+@app.on_event("shutdown")
+async def _shutdown_cpu_pool():
+    """Stop the lag monitor and the CPU worker processes"""
+    await _loop_lag.stop()
+    _cpu_pool.shutdown()
+
+@app.on_event("shutdown")
+async def _shutdown_result_cache():
+    """Stop background refreshes and flush the SQLite backend"""
+    await _result_cache.close()
+
 # API Key security
 API_KEY_HEADER = APIKeyHeader(name="X-API-Key")
 
@@ -125,6 +279,11 @@ class ConversionAnalysisRequest(BaseModel):
     funnel_steps: List[str]
     target_actions: List[str]
 
+class BatchDomainAnalysisRequest(BaseModel):
+    domains: List[str]
+    include_competitors: bool = False
+    deep_analysis: bool = False
+
 # Health check endpoint
 @app.get("/api/health")
 async def health_check():
@@ -141,7 +300,17 @@ async def health_check():
             "browser_automation": SELENIUM_AVAILABLE,
             "machine_learning": ML_AVAILABLE
         },
-        "core_features": ["basic_http_analysis", "content_parsing", "security_headers"]
+        "core_features": ["basic_http_analysis", "content_parsing", "security_headers"],
+        "cache": _result_cache.snapshot(),
+        "dns_cache": get_resolver().stats() if DNS_AVAILABLE else {},
+        "whois_store": get_whois_store().stats() if WHOIS_AVAILABLE else {},
+        "tls": get_tls_probe().stats(),
+        "tech_fingerprint": _tech_fingerprinter.stats(),
+        "single_flight": _single_flight.snapshot(),
+        "performance_monitor": _performance_monitor.snapshot(),
+        "cpu_pool": _cpu_pool.snapshot(),
+        "event_loop": _loop_lag.snapshot(),
+        "batch": _batch_runner.stats()
     }
 
 # Advanced Domain Intelligence
@@ -155,53 +324,158 @@ async def analyze_domain(
     Returns infrastructure, security, performance, and competitive positioning
     """
     try:
-        domain = request.domain.replace('https://', '').replace('http://', '').replace('www.', '')
-        
-        # Parallel analysis tasks
-        tasks = [
-            _analyze_dns_infrastructure(domain),
-            _analyze_ssl_security(domain),
-            _analyze_hosting_intelligence(domain),
-            _analyze_content_structure(f"https://{domain}"),
-        ]
-        
-        if request.include_competitors:
-            tasks.append(_discover_competitors(domain))
-            
-        if request.deep_analysis:
-            tasks.extend([
-                _analyze_technical_stack(domain),
-                _analyze_performance_metrics(f"https://{domain}"),
-                _analyze_content_strategy(f"https://{domain}")
-            ])
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Compile comprehensive intelligence report
-        intelligence_report = {
-            "domain": domain,
-            "analysis_timestamp": datetime.utcnow().isoformat(),
-            "infrastructure": results[0] if not isinstance(results[0], Exception) else {},
-            "security": results[1] if not isinstance(results[1], Exception) else {},
-            "hosting": results[2] if not isinstance(results[2], Exception) else {},
-            "content": results[3] if not isinstance(results[3], Exception) else {},
-            "intelligence_score": _calculate_intelligence_score(results),
-            "strategic_recommendations": _generate_strategic_recommendations(results)
-        }
-        
-        if request.include_competitors and len(results) > 4:
-            intelligence_report["competitive_landscape"] = results[4] if not isinstance(results[4], Exception) else {}
-            
-        if request.deep_analysis and len(results) > 5:
-            intelligence_report["technical_stack"] = results[5] if not isinstance(results[5], Exception) else {}
-            intelligence_report["performance_analysis"] = results[6] if not isinstance(results[6], Exception) else {}
-            intelligence_report["content_strategy"] = results[7] if not isinstance(results[7], Exception) else {}
-        
-        return intelligence_report
+        domain = _normalize_domain(request.domain)
+        key = f"domain-intelligence:{domain}:{request.include_competitors}:{request.deep_analysis}"
+        return await _single_flight.run(
+            key,
+            lambda: _build_intelligence_report(domain, request.include_competitors, request.deep_analysis)
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+async def _build_intelligence_report(domain: str, include_competitors: bool, deep_analysis: bool) -> Dict:
+    """Run every report section concurrently and compile the report"""
+    sections = _domain_sections(domain, include_competitors, deep_analysis)
+    
+    results = await asyncio.gather(*sections.values(), return_exceptions=True)
+    
+    # Compile comprehensive intelligence report
+    intelligence_report = {
+        "domain": domain,
+        "analysis_timestamp": datetime.utcnow().isoformat(),
+    }
+    for name, result in zip(sections, results):
+        intelligence_report[name] = result if not isinstance(result, Exception) else {}
+    intelligence_report["intelligence_score"] = _calculate_intelligence_score(results)
+    intelligence_report["strategic_recommendations"] = _generate_strategic_recommendations(results)
+    
+    return intelligence_report
+
+# Section order of a domain report
+REPORT_SECTIONS = (
+    "infrastructure", "security", "hosting", "content", "competitive_landscape",
+    "technical_stack", "performance_analysis", "content_strategy"
+)
+
+def _domain_sections(domain: str, include_competitors: bool, deep_analysis: bool) -> Dict[str, Awaitable]:
+    """
+    Report section name -> pending probe for one domain, in report order.
+    Each probe is cached under its own TTL; the flags only decide which take part.
+    """
+    # Page is fetched and parsed once, and only if some HTML analyzer misses the cache
+    page = _PageSource(f"https://{domain}")
+    
+    sections = {
+        "infrastructure": _cached("dns", domain, lambda: _analyze_dns_infrastructure(domain), _dns_cache_ttl),
+        "security": _cached("tls", domain, lambda: _analyze_ssl_security(domain), TLS_CACHE_TTL),
+        "hosting": _analyze_hosting_intelligence(domain),  # DNS and WHOIS layers cache themselves
+        "content": _cached("content", domain, lambda: _analyze_content_structure(page.full), HTML_CACHE_TTL),
+    }
+    
+    if include_competitors:
+        sections["competitive_landscape"] = _discover_competitors(domain)
+        
+    if deep_analysis:
+        # Body markers (id="__next", ng-version, ...) and end-of-body <script src> need the whole document
+        sections["technical_stack"] = _cached("technical_stack", domain, lambda: _analyze_technical_stack(page.full), HTML_CACHE_TTL)
+        sections["performance_analysis"] = _cached("performance", domain, lambda: _analyze_performance_metrics(page.full), HTML_CACHE_TTL)
+        sections["content_strategy"] = _cached("content_strategy", domain, lambda: _analyze_content_strategy(page.full), HTML_CACHE_TTL)
+    
+    return sections
+
+def _normalize_domain(raw: str) -> str:
+    """Canonical host used for probing and as cache key: no scheme, path, port, trailing dot or www."""
+    domain = raw.strip().lower()
+    if '://' in domain:
+        domain = domain.split('://', 1)[1]
+    domain = domain.split('/', 1)[0].split(':', 1)[0].rstrip('.')
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+def _cached(probe: str, domain: str, compute: Callable[[], Awaitable[Any]], ttl):
+    """Run a probe through the result cache, keyed by probe type and domain"""
+    return _result_cache.get_or_compute(f"{probe}:{domain}", compute, ttl)
+
+def _dns_cache_ttl(dns_analysis: Dict) -> float:
+    """DNS results live as long as the shortest record TTL in the answer"""
+    ttl = dns_analysis.get("record_ttl") or DNS_CACHE_TTL_DEFAULT
+    return max(float(ttl), DNS_CACHE_TTL_MIN)
+
+class _SingleFlight:
+    """
+    Concurrent calls with the same key share one in-flight task instead of
+    each starting identical outbound probes. Nothing is kept once it finishes
+    (that is the result cache's job). The task is cancelled once every
+    caller waiting on it has gone (deadline, disconnect).
+    """
+    
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self.stats = {"started": 0, "merged": 0, "abandoned": 0}
+    
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            self.stats["started"] += 1
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.stats["merged"] += 1
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # shield: one client disconnecting must not cancel the analysis the others wait on
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    # Last waiter gone - stop the outbound work instead of finishing it for nobody.
+                    # Unregister in the same step so a caller arriving now starts a fresh task
+                    # instead of joining this one and getting its CancelledError.
+                    if self._in_flight.get(key) is task:
+                        del self._in_flight[key]
+                    self.stats["abandoned"] += 1
+                    task.cancel()
+    
+    def _finished(self, key: str, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller went away
+    
+    def snapshot(self) -> Dict[str, int]:
+        return {**self.stats, "in_flight": len(self._in_flight)}
+
+_single_flight = _SingleFlight()
+
+class _PageSource:
+    """
+    Page shared by every HTML analyzer of one request, fetched on first await.
+    Every awaiter of `full` gets the same streamed read of the whole document.
+    """
+    
+    def __init__(self, url: str):
+        self.url = url
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def full(self) -> Awaitable["PageSnapshot"]:
+        return self._get_full()
+    
+    async def _get_full(self) -> "PageSnapshot":
+        if self._task is None:
+            self._task = asyncio.ensure_future(_fetch_page(self.url))
+        return await asyncio.shield(self._task)
+
+async def _resolve(domain: str, rdtype: str):
+    """Non-blocking, TTL-cached DNS query bounded by DNS_TIMEOUT"""
+    return await get_resolver().aresolve(domain, rdtype, lifetime=DNS_TIMEOUT)
+
 async def _analyze_dns_infrastructure(domain: str):
     """Advanced DNS infrastructure analysis"""
     if not DNS_AVAILABLE:
@@ -223,9 +497,15 @@ async def _analyze_dns_infrastructure(domain: str):
             "dns_security": {}
         }
         
+        ns_records, mx_records, txt_records = await asyncio.gather(
+            _resolve(domain, 'NS'),
+            _resolve(domain, 'MX'),
+            _resolve(domain, 'TXT'),
+            return_exceptions=True
+        )
+        
         # Nameservers analysis
-        try:
-            ns_records = dns.resolver.resolve(domain, 'NS')
+        if not isinstance(ns_records, Exception):
             dns_analysis["nameservers"] = [str(ns) for ns in ns_records]
             
             # Detect major DNS providers
@@ -239,20 +519,13 @@ async def _analyze_dns_infrastructure(domain: str):
             for provider, patterns in major_providers.items():
                 if any(pattern in ns for ns in dns_analysis["nameservers"] for pattern in patterns):
                     dns_analysis["cdn_detection"][provider] = True
-                    
-        except Exception:
-            pass
             
         # MX Records
-        try:
-            mx_records = dns.resolver.resolve(domain, 'MX')
+        if not isinstance(mx_records, Exception):
             dns_analysis["mx_records"] = [{"priority": mx.preference, "exchange": str(mx.exchange)} for mx in mx_records]
-        except Exception:
-            pass
             
         # TXT Records (SPF, DKIM, DMARC)
-        try:
-            txt_records = dns.resolver.resolve(domain, 'TXT')
+        if not isinstance(txt_records, Exception):
             for txt in txt_records:
                 txt_str = str(txt)
                 if txt_str.startswith('v=spf1'):
@@ -260,54 +533,90 @@ async def _analyze_dns_infrastructure(domain: str):
                 elif 'dmarc' in txt_str.lower():
                     dns_analysis["dns_security"]["dmarc"] = txt_str
                 dns_analysis["txt_records"].append(txt_str)
-        except Exception:
-            pass
+            
+        ttls = [answer.ttl for answer in (ns_records, mx_records, txt_records)
+                if not isinstance(answer, Exception)]
+        dns_analysis["record_ttl"] = min(ttls) if ttls else None
             
         return dns_analysis
         
     except Exception as e:
         return {"error": str(e)}
 
+def _score_tls_handshake(handshake) -> Dict:
+    """Issuer/expiry/cipher analysis of one handshake"""
+    cert = handshake.cert
+    ssl_analysis = {
+        "certificate_valid": True,
+        "certificate_authority": _cert_issuer_org(cert),
+        "expiry_date": cert.get('notAfter', ''),
+        "cipher_suites": [],
+        "protocol_versions": [],
+        "protocol_version": handshake.protocol,
+        "cipher": handshake.cipher,
+        "security_score": 0
+    }
+    
+    # Calculate security score based on certificate and protocol
+    score = 0
+    if ssl_analysis["protocol_version"] in ['TLSv1.3', 'TLSv1.2']:
+        score += 40
+    if 'Let\'s Encrypt' not in ssl_analysis["certificate_authority"]:
+        score += 30  # Commercial cert
+    if ssl_analysis["cipher"] and ssl_analysis["cipher"][2] >= 256:
+        score += 30  # Strong encryption
+        
+    ssl_analysis["security_score"] = score
+    return ssl_analysis
+
+def _cert_issuer_org(cert: Dict) -> str:
+    """Extract issuer organizationName from a getpeercert() dict"""
+    for rdn in cert.get('issuer', ()):
+        for key, value in rdn:
+            if key == 'organizationName':
+                return value
+    return 'Unknown'
+
 async def _analyze_ssl_security(domain: str):
     """Advanced SSL/TLS security analysis"""
     try:
-        ssl_analysis = {
-            "certificate_valid": False,
-            "certificate_authority": "",
-            "expiry_date": "",
-            "cipher_suites": [],
-            "protocol_versions": [],
-            "security_score": 0
-        }
-        
-        context = ssl.create_default_context()
-        
-        with socket.create_connection((domain, 443), timeout=10) as sock:
-            with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                cert = ssock.getpeercert()
-                
-                ssl_analysis["certificate_valid"] = True
-                ssl_analysis["certificate_authority"] = cert.get('issuer', [{}])[0].get('organizationName', 'Unknown')
-                ssl_analysis["expiry_date"] = cert.get('notAfter', '')
-                ssl_analysis["protocol_version"] = ssock.version()
-                ssl_analysis["cipher"] = ssock.cipher()
-                
-                # Calculate security score based on certificate and protocol
-                score = 0
-                if ssl_analysis["protocol_version"] in ['TLSv1.3', 'TLSv1.2']:
-                    score += 40
-                if 'Let\'s Encrypt' not in ssl_analysis["certificate_authority"]:
-                    score += 30  # Commercial cert
-                if ssl_analysis["cipher"] and ssl_analysis["cipher"][1] >= 256:
-                    score += 30  # Strong encryption
-                    
-                ssl_analysis["security_score"] = score
-                
-        return ssl_analysis
+        probe = get_tls_probe()
+        # Shared context + resumed session; an unchanged certificate reuses its cached analysis
+        handshake = await probe.ahandshake(domain, 443, timeout=TLS_TIMEOUT)
+        return probe.analyze(handshake, "security", _score_tls_handshake)
         
     except Exception as e:
         return {"error": str(e), "certificate_valid": False}
 
+async def _resolve_ip_addresses(domain: str) -> List[str]:
+    """IPv4 addresses for domain - cached A lookup, or the loop's getaddrinfo without dnspython"""
+    if DNS_AVAILABLE:
+        return [str(record) for record in await _resolve(domain, 'A')]
+    
+    loop = asyncio.get_running_loop()
+    infos = await asyncio.wait_for(
+        loop.getaddrinfo(domain, None, family=socket.AF_INET, type=socket.SOCK_STREAM),
+        timeout=DNS_TIMEOUT
+    )
+    # Preserve resolver order while dropping duplicates
+    return list(dict.fromkeys(info[4][0] for info in infos))
+
+async def _whois_lookup(domain: str) -> Dict:
+    """
+    WHOIS via the shared record store: cached records come back instantly and
+    stale ones refresh in the background; misses are single-flight lookups on
+    a worker thread, bounded by WHOIS_TIMEOUT
+    """
+    if not WHOIS_AVAILABLE:
+        return {}
+    record = await get_whois_store().aget(domain, timeout=WHOIS_TIMEOUT)
+    return {
+        "registrar": record["registrar"],
+        "creation_date": record["creation_date"],
+        "expiration_date": record["expiration_date"],
+        "name_servers": record["name_servers"]
+    }
+
 async def _analyze_hosting_intelligence(domain: str):
     """Advanced hosting and infrastructure intelligence"""
     try:
@@ -319,85 +628,155 @@ async def _analyze_hosting_intelligence(domain: str):
             "cdn_analysis": {}
         }
         
-        # IP resolution
-        try:
-            ip_addresses = socket.gethostbyname_ex(domain)[2]
-            hosting_analysis["ip_addresses"] = ip_addresses
-        except Exception:
-            pass
+        # IP resolution and WHOIS run concurrently, each under its own timeout
+        ip_result, whois_result = await asyncio.gather(
+            _resolve_ip_addresses(domain),
+            _whois_lookup(domain),
+            return_exceptions=True
+        )
+        
+        if not isinstance(ip_result, Exception):
+            hosting_analysis["ip_addresses"] = ip_result
             
         # WHOIS analysis
-        try:
-            w = whois.whois(domain)
-            hosting_analysis["whois_data"] = {
-                "registrar": w.registrar,
-                "creation_date": str(w.creation_date) if w.creation_date else None,
-                "expiration_date": str(w.expiration_date) if w.expiration_date else None,
-                "name_servers": w.name_servers if w.name_servers else []
-            }
-        except Exception:
-            pass
+        if not isinstance(whois_result, Exception):
+            hosting_analysis["whois_data"] = whois_result
             
         return hosting_analysis
         
     except Exception as e:
         return {"error": str(e)}
 
-async def _analyze_content_structure(url: str):
+class PageSnapshot:
+    """
+    One fetch, one timing measurement and one parse of a page.
+    Shared by every HTML analyzer of a single request.
+    """
+    
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes, html: str, response_time: float,
+                 timing: Optional[Dict[str, Any]] = None, truncated: Optional[str] = None,
+                 cookies: Optional[List[str]] = None):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.cookies = cookies or []  # names from every Set-Cookie (headers keeps only one)
+        self.body = body
+        self.html = html
+        self.response_time = response_time
+        self.timing = timing or {}
+        self.truncated = truncated  # None, "max_bytes" or "max_time"
+        self._profile: Optional[asyncio.Future] = None
+    
+    def profile(self) -> Awaitable[Dict[str, Any]]:
+        """Parse, readability and keyword profile - computed once, in the CPU pool"""
+        if self._profile is None:
+            self._profile = asyncio.ensure_future(_cpu_pool.run(page_profile, self.html))
+        return asyncio.shield(self._profile)
+
+# Charset declared in the first bytes
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+def _page_encoding(response: aiohttp.ClientResponse, first_chunk: bytes) -> str:
+    """Header charset, else <meta charset>, else UTF-8"""
+    declared = _META_CHARSET.search(first_chunk[:2048])
+    for candidate in (response.charset, declared.group(1).decode('ascii') if declared else None):
+        if candidate:
+            try:
+                return codecs.lookup(candidate).name
+            except LookupError:
+                pass
+    return 'utf-8'
+
+async def _fetch_page(url: str) -> PageSnapshot:
+    """
+    Stream a page through the shared session, decoding text as it arrives.
+    Reading stops at HTML_MAX_BYTES / HTML_MAX_READ_TIME.
+    """
+    start_time = time.time()
+    timings = RequestTimings()
+    
+    async with _get_http_session().get(url, trace_request_ctx=timings.ctx()) as response:
+        # Time to response headers, same measurement the performance analyzer always used
+        response_time = time.time() - start_time
+        deadline = time.monotonic() + HTML_MAX_READ_TIME
+        
+        chunks: List[bytes] = []
+        parts: List[str] = []
+        decoder = None
+        size = 0
+        truncated = None
+        
+        while truncated is None:
+            remaining = deadline - time.monotonic()
+            try:
+                chunk = await asyncio.wait_for(response.content.read(HTML_CHUNK_SIZE), timeout=max(remaining, 0))
+            except asyncio.TimeoutError:
+                truncated = "max_time"
+                break
+            if not chunk:
+                break
+            if size + len(chunk) > HTML_MAX_BYTES:
+                chunk = chunk[:HTML_MAX_BYTES - size]
+                truncated = "max_bytes"
+            size += len(chunk)
+            chunks.append(chunk)
+            # content.read() bypasses on_response_chunk_received, so count the body here
+            timings.bytes = size
+            
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(_page_encoding(response, chunk))(errors='replace')
+            parts.append(decoder.decode(chunk))
+        
+        if truncated is not None:
+            # Unread data left on the socket - don't hand this connection back to the pool
+            response.close()
+        if decoder is not None:
+            parts.append(decoder.decode(b'', final=True))
+        timings.finish()
+        
+        return PageSnapshot(
+            url=url,
+            status=response.status,
+            headers=dict(response.headers),
+            body=b''.join(chunks),
+            html=''.join(parts),
+            response_time=response_time,
+            timing=timings.phases(),
+            truncated=truncated,
+            cookies=list(response.cookies.keys())
+        )
+
+async def _analyze_content_structure(page: Awaitable[PageSnapshot]):
     """Advanced content and SEO structure analysis"""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=15) as response:
-                if response.status != 200:
-                    return {"error": f"HTTP {response.status}"}
-                    
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                content_analysis = {
-                    "meta_analysis": {},
-                    "heading_structure": {},
-                    "content_metrics": {},
-                    "technical_seo": {},
-                    "readability": {}
-                }
-                
-                # Meta analysis
-                title = soup.find('title')
-                description = soup.find('meta', attrs={'name': 'description'})
-                content_analysis["meta_analysis"] = {
-                    "title": title.text if title else "",
-                    "description": description.get('content') if description else "",
-                    "title_length": len(title.text) if title else 0,
-                    "description_length": len(description.get('content')) if description else 0
-                }
-                
-                # Heading structure
-                headings = {}
-                for i in range(1, 7):
-                    h_tags = soup.find_all(f'h{i}')
-                    headings[f'h{i}'] = len(h_tags)
-                content_analysis["heading_structure"] = headings
-                
-                # Content metrics
-                text_content = soup.get_text()
-                content_analysis["content_metrics"] = {
-                    "word_count": len(text_content.split()),
-                    "character_count": len(text_content),
-                    "paragraph_count": len(soup.find_all('p')),
-                    "image_count": len(soup.find_all('img')),
-                    "link_count": len(soup.find_all('a'))
-                }
-                
-                # Readability analysis
-                if len(text_content.split()) > 100:
-                    content_analysis["readability"] = {
-                        "flesch_reading_ease": flesch_reading_ease(text_content),
-                        "flesch_kincaid_grade": flesch_kincaid_grade(text_content)
-                    }
-                
-                return content_analysis
-                
+        snapshot = await page
+        if snapshot.status != 200:
+            return {"error": f"HTTP {snapshot.status}"}
+            
+        # Parsing and readability scoring run off the event loop
+        profile = await snapshot.profile()
+        
+        content_analysis = {
+            "meta_analysis": {
+                "title": profile["title"],
+                "description": profile["description"],
+                "title_length": len(profile["title"]),
+                "description_length": len(profile["description"])
+            },
+            "heading_structure": profile["headings"],
+            "content_metrics": {
+                "word_count": profile["word_count"],
+                "character_count": profile["character_count"],
+                "paragraph_count": profile["paragraph_count"],
+                "image_count": profile["image_count"],
+                "link_count": profile["link_count"]
+            },
+            "technical_seo": {},
+            "readability": profile["readability"]
+        }
+        
+        return content_analysis
+        
     except Exception as e:
         return {"error": str(e)}
 
@@ -410,80 +789,87 @@ async def _discover_competitors(domain: str):
         "confidence_scores": {}
     }
 
-async def _analyze_technical_stack(domain: str):
+# Signature categories reported in the legacy per-kind lists
+TECH_CATEGORY_FIELDS = {
+    "framework": "frameworks_detected",
+    "javascript_library": "javascript_libraries",
+    "css_framework": "css_frameworks",
+    "analytics": "analytics_tools",
+    "tag_manager": "analytics_tools",
+}
+
+async def _analyze_technical_stack(page: Awaitable[PageSnapshot]):
     """Technical stack detection and analysis"""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://{domain}", timeout=15) as response:
-                headers = dict(response.headers)
-                html = await response.text()
-                
-                stack_analysis = {
-                    "server_headers": {},
-                    "frameworks_detected": [],
-                    "javascript_libraries": [],
-                    "css_frameworks": [],
-                    "analytics_tools": []
-                }
-                
-                # Analyze server headers
-                interesting_headers = ['server', 'x-powered-by', 'x-frame-options', 'x-content-type-options']
-                for header in interesting_headers:
-                    if header in headers:
-                        stack_analysis["server_headers"][header] = headers[header]
-                
-                # Detect common frameworks and libraries
-                html_lower = html.lower()
-                
-                # JavaScript frameworks
-                js_frameworks = {
-                    'react': ['react', '_react'],
-                    'vue': ['vue.js', '__vue__'],
-                    'angular': ['angular', 'ng-'],
-                    'jquery': ['jquery', '$'],
-                    'next.js': ['__next', '_next']
-                }
-                
-                for framework, patterns in js_frameworks.items():
-                    if any(pattern in html_lower for pattern in patterns):
-                        stack_analysis["frameworks_detected"].append(framework)
-                
-                return stack_analysis
-                
+        snapshot = await page
+        # Header names are case-insensitive on the wire
+        headers = {name.lower(): value for name, value in snapshot.headers.items()}
+        html = snapshot.html
+        
+        stack_analysis = {
+            "server_headers": {},
+            "frameworks_detected": [],
+            "javascript_libraries": [],
+            "css_frameworks": [],
+            "analytics_tools": []
+        }
+        
+        # Analyze server headers
+        interesting_headers = ['server', 'x-powered-by', 'x-frame-options', 'x-content-type-options']
+        for header in interesting_headers:
+            if header in headers:
+                stack_analysis["server_headers"][header] = headers[header]
+        
+        # One scan per source (html, script srcs, meta, headers, cookies) against the whole signature DB
+        technologies = _tech_fingerprinter.detect(html, headers, snapshot.cookies)
+        for tech in technologies:
+            field = TECH_CATEGORY_FIELDS.get(tech["category"])
+            if field:
+                stack_analysis[field].append(tech["name"])
+        stack_analysis["technologies"] = technologies
+        
+        return stack_analysis
+        
     except Exception as e:
         return {"error": str(e)}
 
-async def _analyze_performance_metrics(url: str):
+async def _analyze_performance_metrics(page: Awaitable[PageSnapshot]):
     """Performance analysis using Python-based metrics"""
     try:
-        start_time = time.time()
+        snapshot = await page
+        
+        performance_analysis = {
+            "response_time": snapshot.response_time,
+            "status_code": snapshot.status,
+            "content_size": len(snapshot.body),
+            "content_truncated": snapshot.truncated,
+            "response_headers": snapshot.headers,
+            "timing": snapshot.timing,
+            "performance_score": _calculate_performance_score(snapshot.response_time, snapshot.status, snapshot.timing)
+        }
+        
+        return performance_analysis
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=15) as response:
-                load_time = time.time() - start_time
-                
-                performance_analysis = {
-                    "response_time": load_time,
-                    "status_code": response.status,
-                    "content_size": len(await response.read()),
-                    "response_headers": dict(response.headers),
-                    "performance_score": _calculate_performance_score(load_time, response.status)
-                }
-                
-                return performance_analysis
-                
     except Exception as e:
         return {"error": str(e)}
 
-async def _analyze_content_strategy(url: str):
+async def _analyze_content_strategy(page: Awaitable[PageSnapshot]):
     """Advanced content strategy analysis"""
-    # Placeholder for advanced content analysis
-    return {
-        "content_themes": [],
-        "keyword_density": {},
-        "content_structure_score": 0,
-        "engagement_indicators": {}
-    }
+    try:
+        snapshot = await page
+        
+        # Keyword density comes with the page profile (same worker pass as the parse)
+        profile = await snapshot.profile()
+        
+        return {
+            "content_themes": [],
+            "keyword_density": profile["keyword_density"],
+            "content_structure_score": 0,
+            "engagement_indicators": {}
+        }
+        
+    except Exception as e:
+        return {"error": str(e)}
 
 def _calculate_intelligence_score(results: List) -> int:
     """Calculate overall intelligence score based on analysis results"""
@@ -516,13 +902,26 @@ def _generate_strategic_recommendations(results: List) -> List[str]:
         
     return recommendations
 
-def _calculate_performance_score(load_time: float, status_code: int) -> int:
-    """Calculate performance score based on metrics"""
+def _calculate_performance_score(load_time: float, status_code: int, timing: Optional[Dict] = None) -> int:
+    """Calculate performance score based on metrics (per-phase when timing is available)"""
     score = 100
     
     if status_code != 200:
         score -= 50
-    if load_time > 2.0:
+    
+    if timing and timing.get("ttfb") is not None:
+        # Blame the phase that is actually slow instead of the whole round trip
+        if timing["ttfb"] > SLOW_TTFB:
+            score -= 25
+        elif timing["ttfb"] > 0.8:
+            score -= 10
+        if timing["dns"] > SLOW_DNS:
+            score -= 10
+        if timing["connect"] > SLOW_CONNECT:
+            score -= 10
+        if (timing.get("download") or 0) > SLOW_DOWNLOAD:
+            score -= 15
+    elif load_time > 2.0:
         score -= 30
     elif load_time > 1.0:
         score -= 15
@@ -539,21 +938,19 @@ async def competitive_intelligence(
     Advanced competitive intelligence analysis
     """
     try:
-        primary_analysis = await analyze_domain(
-            DomainAnalysisRequest(domain=request.primary_domain, deep_analysis=True),
-            api_key
-        )
+        primary_analysis = {}
+        competitor_results = {}
+        async for index, analysis in _iter_competitive_analyses(request, api_key):
+            if index is None:
+                primary_analysis = analysis
+            else:
+                competitor_results[index] = analysis
         
-        competitor_analyses = []
-        for competitor in request.competitor_domains:
-            comp_analysis = await analyze_domain(
-                DomainAnalysisRequest(domain=competitor, deep_analysis=False),
-                api_key
-            )
-            competitor_analyses.append({
-                "domain": competitor,
-                "analysis": comp_analysis
-            })
+        # Keep the order the competitors were requested in
+        competitor_analyses = [
+            {"domain": competitor, "analysis": competitor_results.get(index, {})}
+            for index, competitor in enumerate(request.competitor_domains)
+        ]
         
         # Comparative analysis
         intelligence_report = {
@@ -569,6 +966,179 @@ async def competitive_intelligence(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Competitive intelligence failed: {str(e)}")
 
+async def _iter_competitive_analyses(request: CompetitorIntelligenceRequest, api_key: str):
+    """
+    Run the primary (deep) and competitor analyses concurrently and yield
+    (competitor_index, analysis) as each one finishes; the primary uses index None.
+    Competitors share a COMPETITOR_CONCURRENCY limit and everything shares
+    COMPETITIVE_DEADLINE - unfinished domains are yielded as timed out.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + COMPETITIVE_DEADLINE
+    semaphore = asyncio.Semaphore(COMPETITOR_CONCURRENCY)
+    
+    async def analyze_competitor(domain: str):
+        async with semaphore:
+            return await analyze_domain(DomainAnalysisRequest(domain=domain, deep_analysis=False), api_key)
+    
+    # The primary is never queued behind competitors
+    tasks = {
+        asyncio.ensure_future(
+            analyze_domain(DomainAnalysisRequest(domain=request.primary_domain, deep_analysis=True), api_key)
+        ): None
+    }
+    for index, competitor in enumerate(request.competitor_domains):
+        tasks[asyncio.ensure_future(analyze_competitor(competitor))] = index
+    
+    pending = set(tasks)
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is not None:
+                    yield tasks[task], {"error": str(getattr(error, 'detail', error))}
+                else:
+                    yield tasks[task], task.result()
+        
+        for task in pending:
+            yield tasks[task], {"error": f"Analysis exceeded {COMPETITIVE_DEADLINE:g}s deadline", "timed_out": True}
+    finally:
+        for task in pending:
+            task.cancel()
+
+@app.post("/api/competitive-intelligence/stream")
+async def competitive_intelligence_stream(
+    request: CompetitorIntelligenceRequest,
+    format: str = "ndjson",
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Streaming competitive intelligence (format=ndjson or format=sse).
+    Each domain section is sent as soon as it is ready; comparative_insights and
+    strategic_positioning come last. Only compact score summaries are kept
+    for sections already sent.
+    """
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+    
+    def encode(event: Dict) -> str:
+        payload = json.dumps(event, default=str)
+        if format == "sse":
+            return f"event: {event['type']}\ndata: {payload}\n\n"
+        return payload + "\n"
+    
+    async def events():
+        domains = [request.primary_domain, *request.competitor_domains]
+        summaries: Dict[Optional[int], Dict[str, Dict]] = {}
+        timed_out = []
+        
+        try:
+            async for index, section, result in _iter_competitive_sections(request, api_key):
+                domain = request.primary_domain if index is None else request.competitor_domains[index]
+                role = "primary" if index is None else "competitor"
+                
+                if section is not None:
+                    summaries.setdefault(index, {})[section] = _section_summary(result)
+                    yield encode({"type": "section", "domain": domain, "role": role, "section": section, "data": result})
+                    continue
+                
+                # Domain finished (or ran out of time) - score it from the retained summaries
+                if result is not None:
+                    timed_out.append(domain)
+                # Report order, as the scoring helpers expect
+                domain_summaries = [summary for name, summary in sorted(
+                    summaries.get(index, {}).items(), key=lambda item: REPORT_SECTIONS.index(item[0])
+                )]
+                yield encode({
+                    "type": "domain_complete",
+                    "domain": domain,
+                    "role": role,
+                    "timed_out": result is not None,
+                    "intelligence_score": _calculate_intelligence_score(domain_summaries),
+                    "strategic_recommendations": _generate_strategic_recommendations(domain_summaries)
+                })
+            
+            primary_summary = {"domain": request.primary_domain, "analysis": summaries.get(None, {})}
+            competitor_summaries = [
+                {"domain": competitor, "analysis": summaries.get(index, {})}
+                for index, competitor in enumerate(request.competitor_domains)
+            ]
+            yield encode({"type": "comparative_insights", "data": _generate_comparative_insights(primary_summary, competitor_summaries)})
+            yield encode({"type": "strategic_positioning", "data": _analyze_strategic_positioning(primary_summary, competitor_summaries)})
+            yield encode({"type": "complete", "domains": len(domains), "timed_out": timed_out})
+            
+        except Exception as e:
+            yield encode({"type": "error", "detail": f"Competitive intelligence failed: {str(e)}"})
+    
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+async def _iter_competitive_sections(request: CompetitorIntelligenceRequest, api_key: str):
+    """
+    Section-level variant of _iter_competitive_analyses.
+    Yields (competitor_index, section, result) per finished section, then
+    (competitor_index, None, None) once a domain is done. Domains still running
+    at COMPETITIVE_DEADLINE are closed with (competitor_index, None, {"timed_out": True}).
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + COMPETITIVE_DEADLINE
+    semaphore = asyncio.Semaphore(COMPETITOR_CONCURRENCY)
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def run_section(index: Optional[int], name: str, probe: Awaitable):
+        try:
+            result = await probe
+        except Exception as e:
+            result = {"error": str(e)}
+        await queue.put((index, name, result))
+    
+    async def run_domain(index: Optional[int], domain: str, deep_analysis: bool):
+        sections = _domain_sections(_normalize_domain(domain), True, deep_analysis)
+        await asyncio.gather(*(run_section(index, name, probe) for name, probe in sections.items()))
+        await queue.put((index, None, None))
+    
+    async def run_competitor(index: int, domain: str):
+        async with semaphore:
+            await run_domain(index, domain, False)
+    
+    # The primary is never queued behind competitors
+    workers = [asyncio.ensure_future(run_domain(None, request.primary_domain, True))]
+    workers.extend(
+        asyncio.ensure_future(run_competitor(index, competitor))
+        for index, competitor in enumerate(request.competitor_domains)
+    )
+    unfinished = {None, *range(len(request.competitor_domains))}
+    
+    try:
+        while unfinished:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                index, section, result = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if section is None:
+                unfinished.discard(index)
+            yield index, section, result
+        
+        for index in unfinished:
+            yield index, None, {"timed_out": True}
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+def _section_summary(result: Any) -> Dict:
+    """Scoring fields of a section result - all the stream keeps once it is sent"""
+    if not isinstance(result, dict):
+        return {}
+    keep = ("error", "certificate_valid", "security_score", "performance_score")
+    return {key: result[key] for key in keep if key in result}
+
 def _generate_comparative_insights(primary: Dict, competitors: List[Dict]) -> Dict:
     """Generate comparative intelligence insights"""
     return {
@@ -587,17 +1157,156 @@ def _analyze_strategic_positioning(primary: Dict, competitors: List[Dict]) -> Di
         "strategic_recommendations": []
     }
 
+# Batch Domain Intelligence
+async def _analyze_batch_domain(domain: str, options: Dict[str, Any]) -> Dict:
+    """One batch item - same analysis as /api/domain-intelligence"""
+    return await analyze_domain(
+        DomainAnalysisRequest(domain=domain, **options),
+        api_key=None
+    )
+
+_batch_runner = BatchRunner(
+    analyze=_analyze_batch_domain,
+    workers=BATCH_WORKERS,
+    host_interval=BATCH_HOST_INTERVAL,
+    job_ttl=BATCH_JOB_TTL,
+    max_jobs=BATCH_MAX_JOBS,
+    host_key=_normalize_domain
+)
+
+@app.post("/api/domain-intelligence/batch", status_code=202)
+async def submit_batch_analysis(
+    request: BatchDomainAnalysisRequest,
+    background_tasks: BackgroundTasks,
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Submit many domains for analysis; returns a job id to poll
+    """
+    domains = [domain.strip() for domain in request.domains if domain.strip()]
+    if not domains:
+        raise HTTPException(status_code=400, detail="No domains submitted")
+    if len(domains) > BATCH_MAX_DOMAINS:
+        raise HTTPException(status_code=400, detail=f"Batch too large (max {BATCH_MAX_DOMAINS} domains)")
+    
+    try:
+        job = _batch_runner.submit(domains, {
+            "include_competitors": request.include_competitors,
+            "deep_analysis": request.deep_analysis
+        })
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    
+    # Queued once the 202 is on its way; the worker pool does the rest
+    background_tasks.add_task(_batch_runner.enqueue, job)
+    
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "total": len(domains),
+        "status_url": f"/api/domain-intelligence/batch/{job.id}",
+        "results_url": f"/api/domain-intelligence/batch/{job.id}/results"
+    }
+
+@app.get("/api/domain-intelligence/batch/{job_id}")
+async def batch_analysis_status(
+    job_id: str,
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Batch job progress
+    """
+    return _get_batch_job(job_id).progress()
+
+@app.get("/api/domain-intelligence/batch/{job_id}/results")
+async def batch_analysis_results(
+    job_id: str,
+    offset: int = 0,
+    limit: int = 50,
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Page through batch results in submission order
+    """
+    if offset < 0 or not 1 <= limit <= 500:
+        raise HTTPException(status_code=400, detail="offset must be >= 0 and limit between 1 and 500")
+    return _get_batch_job(job_id).page(offset, limit)
+
+@app.delete("/api/domain-intelligence/batch/{job_id}")
+async def cancel_batch_analysis(
+    job_id: str,
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Cancel the job's remaining domains (finished results are kept)
+    """
+    job = _get_batch_job(job_id)
+    _batch_runner.cancel(job)
+    return job.progress()
+
+def _get_batch_job(job_id: str):
+    job = _batch_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    return job
+
 # Real-time Performance Monitoring
+async def _sample_performance(domain: str) -> Dict:
+    """One background sample for the performance monitor"""
+    return await _analyze_performance_metrics(_fetch_page(f"https://{domain}"))
+
+_performance_monitor = PerformanceMonitor(
+    sample=_sample_performance,
+    interval=PERF_SAMPLE_INTERVAL,
+    concurrency=PERF_CONCURRENCY,
+    max_domains=PERF_MAX_DOMAINS,
+    idle_ttl=PERF_IDLE_TTL,
+    raw_capacity=PERF_RAW_SAMPLES
+)
+
+# Window length units accepted by the monitor endpoint
+_WINDOW_UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+def _parse_window(window: str) -> float:
+    """'15m' / '6h' / '7d' -> seconds"""
+    match = re.fullmatch(r"(\d+)([mhd])", window.strip().lower())
+    if not match or int(match.group(1)) == 0:
+        raise HTTPException(status_code=400, detail="window must look like 15m, 6h or 7d")
+    return int(match.group(1)) * _WINDOW_UNITS[match.group(2)]
+
+def _default_resolution(window: float) -> str:
+    if window <= 6 * 3600:
+        return "1m"
+    if window <= 7 * 86400:
+        return "1h"
+    return "1d"
+
 @app.get("/api/performance-monitor/{domain}")
 async def performance_monitor(
     domain: str,
+    window: str = "1h",
+    resolution: Optional[str] = None,
     api_key: str = Depends(verify_api_key)
 ):
     """
-    Real-time performance monitoring endpoint
+    Performance time series for a domain.
+    The first query registers the domain for background sampling; queries only
+    read stored samples and never trigger a live fetch.
     """
+    window_seconds = _parse_window(window)
+    resolution = resolution or _default_resolution(window_seconds)
+    if resolution != "raw" and resolution not in ROLLUPS:
+        raise HTTPException(status_code=400, detail=f"resolution must be raw or one of {', '.join(ROLLUPS)}")
+    
+    domain = _normalize_domain(domain)
     try:
-        performance_data = await _analyze_performance_metrics(f"https://{domain}")
+        series = _performance_monitor.watch(domain)
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    
+    try:
+        history = series.query(window_seconds, resolution)
+        performance_data = dict(series.latest) if series.latest else {}
         
         # Add real-time system metrics if analyzing localhost
         if 'localhost' in domain:
@@ -610,21 +1319,42 @@ async def performance_monitor(
         return {
             "domain": domain,
             "timestamp": datetime.utcnow().isoformat(),
+            "status": "sampling" if series.latest else "warming_up",
+            "sample_interval": PERF_SAMPLE_INTERVAL,
+            "window": window,
             "performance": performance_data,
-            "alerts": _generate_performance_alerts(performance_data)
+            "summary": history["summary"],
+            "series": history,
+            "alerts": _generate_performance_alerts(performance_data, history["summary"]) if series.latest else []
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Performance monitoring failed: {str(e)}")
 
-def _generate_performance_alerts(performance_data: Dict) -> List[str]:
-    """Generate performance alerts based on thresholds"""
+def _generate_performance_alerts(performance_data: Dict, summary: Optional[Dict] = None) -> List[str]:
+    """Generate performance alerts from the latest sample and the window summary"""
     alerts = []
     
     if performance_data.get('response_time', 0) > 3.0:
         alerts.append("High response time detected")
     if performance_data.get('status_code') != 200:
         alerts.append("Non-200 status code detected")
+    
+    timing = performance_data.get('timing') or {}
+    if timing.get('dns', 0) > SLOW_DNS:
+        alerts.append(f"Slow DNS resolution ({timing['dns']}s)")
+    if timing.get('connect', 0) > SLOW_CONNECT:
+        alerts.append(f"Slow connection setup, TCP + TLS ({timing['connect']}s)")
+    if (timing.get('ttfb') or 0) > SLOW_TTFB:
+        alerts.append(f"Slow server response, TTFB {timing['ttfb']}s")
+    if (timing.get('download') or 0) > SLOW_DOWNLOAD:
+        alerts.append(f"Slow content download ({timing['download']}s for {timing.get('bytes', 0)} bytes)")
+    
+    if summary and summary.get("samples"):
+        if summary.get("p95") is not None and summary["p95"] > PERF_P95_ALERT:
+            alerts.append(f"p95 response time {summary['p95']}s exceeds {PERF_P95_ALERT}s over the window")
+        if summary["error_rate"] > PERF_ERROR_RATE_ALERT:
+            alerts.append(f"Error rate {summary['error_rate']:.1%} over the window")
         
     return alerts
 
@@ -0,0 +1,290 @@
+"""
+ARCO Intelligence API - Performance time series
+Background sampling of watched domains into a columnar ring buffer plus 1m/1h/1d rollups
+"""
+
+import asyncio
+import math
+import time
+from array import array
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Rollup resolution -> (bucket width in seconds, buckets kept)
+ROLLUPS = {
+    "1m": (60, 1440),   # one day
+    "1h": (3600, 168),  # one week
+    "1d": (86400, 90),  # one quarter
+}
+
+# Response times go into log-spaced histogram bins (~5% wide), so rollups merge
+# exactly and p50/p95/p99 stay within a bin width of the true value
+_BIN_BASE = 0.001
+_BIN_GROWTH = math.log(1.05)
+
+
+def _bin_of(seconds: float) -> int:
+    if seconds <= _BIN_BASE:
+        return 0
+    return int(math.log(seconds / _BIN_BASE) / _BIN_GROWTH) + 1
+
+
+def _bin_value(index: int) -> float:
+    """Geometric middle of a bin"""
+    if index == 0:
+        return _BIN_BASE
+    return _BIN_BASE * math.exp((index - 0.5) * _BIN_GROWTH)
+
+
+class _Bucket:
+    """Aggregate of the samples in one time bucket"""
+
+    __slots__ = ("start", "count", "errors", "timed", "total", "min", "max", "bins")
+
+    def __init__(self, start: float):
+        self.start = start
+        self.count = 0
+        self.errors = 0
+        self.timed = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.bins: Dict[int, int] = {}
+
+    def add(self, response_time: Optional[float], ok: bool):
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        if response_time is None:
+            return
+        self.timed += 1
+        self.total += response_time
+        self.min = min(self.min, response_time)
+        self.max = max(self.max, response_time)
+        index = _bin_of(response_time)
+        self.bins[index] = self.bins.get(index, 0) + 1
+
+    def merge(self, other: "_Bucket"):
+        self.count += other.count
+        self.errors += other.errors
+        self.timed += other.timed
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.timed:
+            return None
+        rank = q * self.timed
+        seen = 0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen >= rank:
+                # Clamp to what was actually observed
+                return round(min(max(_bin_value(index), self.min), self.max), 4)
+        return round(self.max, 4)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "start": self.start,
+            "samples": self.count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.count, 4) if self.count else 0.0,
+            "mean": round(self.total / self.timed, 4) if self.timed else None,
+            "min": round(self.min, 4) if self.timed else None,
+            "max": round(self.max, 4) if self.timed else None,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+class _RawRing:
+    """Fixed-size columnar ring of the most recent samples (timestamp, response time, status)"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = array("d", [0.0] * capacity)
+        self.response_times = array("d", [math.nan] * capacity)
+        self.statuses = array("H", [0] * capacity)
+        self.size = 0
+        self._next = 0
+
+    def append(self, timestamp: float, response_time: Optional[float], status: int):
+        self.timestamps[self._next] = timestamp
+        self.response_times[self._next] = math.nan if response_time is None else response_time
+        self.statuses[self._next] = status
+        self._next = (self._next + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def since(self, cutoff: float) -> List[Dict[str, Any]]:
+        """Samples newer than cutoff, oldest first"""
+        start = (self._next - self.size) % self.capacity
+        samples = []
+        for offset in range(self.size):
+            i = (start + offset) % self.capacity
+            if self.timestamps[i] < cutoff:
+                continue
+            response_time = self.response_times[i]
+            samples.append({
+                "timestamp": self.timestamps[i],
+                "response_time": None if math.isnan(response_time) else round(response_time, 4),
+                "status_code": self.statuses[i] or None,
+            })
+        return samples
+
+
+class DomainSeries:
+    """Raw ring plus every rollup resolution for one domain"""
+
+    def __init__(self, raw_capacity: int):
+        self.raw = _RawRing(raw_capacity)
+        self.rollups: Dict[str, deque] = {
+            name: deque(maxlen=keep) for name, (_, keep) in ROLLUPS.items()
+        }
+        self.latest: Optional[Dict[str, Any]] = None
+
+    def record(self, timestamp: float, sample: Dict[str, Any]):
+        ok = "error" not in sample and sample.get("status_code") == 200
+        response_time = sample.get("response_time") if "error" not in sample else None
+        status = sample.get("status_code") or 0
+
+        self.raw.append(timestamp, response_time, status)
+        for name, (width, _) in ROLLUPS.items():
+            buckets = self.rollups[name]
+            start = timestamp - timestamp % width
+            if not buckets or buckets[-1].start != start:
+                buckets.append(_Bucket(start))
+            buckets[-1].add(response_time, ok)
+        self.latest = {**sample, "sampled_at": timestamp}
+
+    def query(self, window: float, resolution: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """Points at the given resolution plus one summary for the whole window"""
+        now = now if now is not None else time.time()
+        cutoff = now - window
+        total = _Bucket(cutoff)
+
+        if resolution == "raw":
+            points = self.raw.since(cutoff)
+            for point in points:
+                total.add(point["response_time"], point["status_code"] == 200)
+        else:
+            width = ROLLUPS[resolution][0]
+            points = []
+            for bucket in self.rollups[resolution]:
+                if bucket.start + width <= cutoff:
+                    continue
+                total.merge(bucket)
+                points.append(bucket.summary())
+
+        summary = total.summary()
+        del summary["start"]
+        return {"resolution": resolution, "points": points, "summary": summary}
+
+
+class _Watched:
+    __slots__ = ("series", "next_due", "last_queried")
+
+    def __init__(self, raw_capacity: int):
+        self.series = DomainSeries(raw_capacity)
+        self.next_due = 0.0
+        self.last_queried = time.monotonic()
+
+
+class PerformanceMonitor:
+    """
+    Samples every watched domain each interval seconds (at most concurrency at
+    a time) and keeps the results in a DomainSeries. Domains nobody has queried
+    for idle_ttl seconds stop being sampled.
+    """
+
+    def __init__(
+        self,
+        sample: Callable[[str], Awaitable[Dict[str, Any]]],
+        interval: float = 60.0,
+        concurrency: int = 4,
+        max_domains: int = 200,
+        idle_ttl: float = 86400.0,
+        raw_capacity: int = 1440
+    ):
+        self.sample = sample
+        self.interval = interval
+        self.concurrency = concurrency
+        self.max_domains = max_domains
+        self.idle_ttl = idle_ttl
+        self.raw_capacity = raw_capacity
+        self.watched: Dict[str, _Watched] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.stats = {"samples": 0, "failed_samples": 0, "expired": 0}
+
+    def start(self):
+        """Start the scheduler (idempotent)"""
+        if self._task is None or self._task.done():
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._task = asyncio.ensure_future(self._scheduler())
+
+    async def stop(self):
+        """Stop the scheduler and any samples in progress"""
+        tasks = [t for t in [self._task, *self._in_flight.values()] if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._in_flight.clear()
+
+    def watch(self, domain: str) -> DomainSeries:
+        """Series for the domain, registering it for sampling if it isn't yet"""
+        watched = self.watched.get(domain)
+        if watched is None:
+            self._expire_idle()
+            if len(self.watched) >= self.max_domains:
+                raise RuntimeError(f"Too many monitored domains (max {self.max_domains})")
+            watched = self.watched[domain] = _Watched(self.raw_capacity)
+            self.start()
+        watched.last_queried = time.monotonic()
+        return watched.series
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "domains": len(self.watched),
+            "sampling": len(self._in_flight),
+            "interval": self.interval,
+        }
+
+    async def _scheduler(self):
+        tick = min(1.0, self.interval)
+        while True:
+            self._expire_idle()
+            now = time.monotonic()
+            for domain, watched in list(self.watched.items()):
+                if watched.next_due <= now and domain not in self._in_flight:
+                    watched.next_due = now + self.interval
+                    self._in_flight[domain] = asyncio.ensure_future(self._take(domain, watched))
+            await asyncio.sleep(tick)
+
+    async def _take(self, domain: str, watched: _Watched):
+        try:
+            async with self._slots:
+                try:
+                    sample = await self.sample(domain)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    sample = {"error": str(e)}
+            watched.series.record(time.time(), sample)
+            self.stats["samples"] += 1
+            if "error" in sample:
+                self.stats["failed_samples"] += 1
+        finally:
+            self._in_flight.pop(domain, None)
+
+    def _expire_idle(self):
+        cutoff = time.monotonic() - self.idle_ttl
+        for domain in [d for d, w in self.watched.items() if w.last_queried < cutoff]:
+            del self.watched[domain]
+            self.stats["expired"] += 1
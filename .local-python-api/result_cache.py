@@ -0,0 +1,186 @@
+"""
+ARCO Intelligence API - Probe result cache
+TTL cache with stale-while-revalidate, LRU memory cap and optional SQLite persistence
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+# ttl may be fixed or derived from the computed value (e.g. DNS record TTL)
+TTL = Union[float, Callable[[Any], float]]
+
+
+def _is_cacheable(value: Any) -> bool:
+    """Failed probes report {"error": ...} and must not be cached"""
+    return not (isinstance(value, dict) and "error" in value)
+
+
+class ResultCache:
+    """
+    Two-level probe result cache.
+    Memory is an LRU of JSON payloads (callers always get an independent copy);
+    SQLite, when configured, keeps entries across restarts.
+    """
+
+    def __init__(self, max_entries: int = 1024, stale_factor: float = 1.0, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.stale_factor = stale_factor
+        self.db_path = db_path
+        # key -> (payload, expires_at, stale_until)
+        self._entries: "OrderedDict[str, Tuple[str, float, float]]" = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._db_writes = 0
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "evictions": 0,
+            "disk_hits": 0
+        }
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS probe_results ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, stale_until REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: TTL,
+        cacheable: Callable[[Any], bool] = _is_cacheable
+    ) -> Any:
+        """
+        Fresh entry -> cached value.
+        Stale entry -> cached value now, refresh scheduled in the background.
+        Missing/expired -> compute, store, return.
+        """
+        entry = self._memory_get(key)
+        if entry is None and self._db is not None:
+            entry = await asyncio.to_thread(self._disk_get, key)
+            if entry is not None:
+                self.stats["disk_hits"] += 1
+                self._memory_put(key, entry)
+
+        now = time.time()
+        if entry is not None:
+            payload, expires_at, stale_until = entry
+            if now < expires_at:
+                self.stats["hits"] += 1
+                return json.loads(payload)
+            if now < stale_until:
+                self.stats["stale_hits"] += 1
+                self._schedule_refresh(key, compute, ttl, cacheable)
+                return json.loads(payload)
+
+        self.stats["misses"] += 1
+        value = await compute()
+        if cacheable(value):
+            await self._store(key, value, ttl)
+        return value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters and sizes for the health endpoint"""
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "refreshing": len(self._refreshing),
+            "persistent": self._db is not None
+        }
+
+    async def close(self):
+        """Cancel pending refreshes and close the SQLite backend"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+
+    def _schedule_refresh(self, key: str, compute, ttl: TTL, cacheable):
+        """At most one background refresh per key"""
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                value = await compute()
+                if cacheable(value):
+                    await self._store(key, value, ttl)
+            except Exception:
+                # Keep serving the stale entry; the next stale hit retries
+                pass
+            finally:
+                self._refreshing.pop(key, None)
+
+        self.stats["refreshes"] += 1
+        self._refreshing[key] = asyncio.ensure_future(refresh())
+
+    async def _store(self, key: str, value: Any, ttl: TTL):
+        seconds = ttl(value) if callable(ttl) else ttl
+        if seconds <= 0:
+            return
+        now = time.time()
+        entry = (
+            json.dumps(value, default=str),
+            now + seconds,
+            now + seconds * (1 + self.stale_factor)
+        )
+        self._memory_put(key, entry)
+        if self._db is not None:
+            await asyncio.to_thread(self._disk_put, key, entry)
+
+    def _memory_get(self, key: str) -> Optional[Tuple[str, float, float]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _memory_put(self, key: str, entry: Tuple[str, float, float]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _disk_get(self, key: str) -> Optional[Tuple[str, float, float]]:
+        with self._db_lock:
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT payload, expires_at, stale_until FROM probe_results WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if row is None or row[2] <= time.time():
+            return None
+        return row
+
+    def _disk_put(self, key: str, entry: Tuple[str, float, float]):
+        with self._db_lock:
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO probe_results (key, payload, expires_at, stale_until) "
+                "VALUES (?, ?, ?, ?)",
+                (key, *entry)
+            )
+            self._db_writes += 1
+            # Purge dead rows now and then so the file doesn't grow without bound
+            if self._db_writes % 500 == 0:
+                self._db.execute("DELETE FROM probe_results WHERE stale_until <= ?", (time.time(),))
+            self._db.commit()
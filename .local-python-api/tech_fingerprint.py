@@ -0,0 +1,201 @@
+"""
+ARCO Intelligence API - Technology fingerprinting
+Declarative signature DB compiled once into multi-pattern matchers
+
+Each signature (see tech_signatures.json) lists lowercase literals per source:
+    headers  {header name: [value substrings]}   "" = header present
+    cookies  [cookie name prefixes]
+    scripts  [<script src> substrings]
+    meta     {meta name: [content substrings]}  e.g. generator
+    html     [document substrings]
+
+Every source is scanned once, whatever the number of signatures: with
+pyahocorasick installed an Aho-Corasick automaton is used, otherwise the
+literals are folded into a trie-shaped regex.
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Set
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+SIGNATURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tech_signatures.json")
+
+SOURCES = ("headers", "cookies", "scripts", "meta", "html")
+
+# <script ...> and <meta ...> tags, and their attributes
+_TAG = re.compile(r'<(script|meta)\b([^>]*)>', re.IGNORECASE)
+_ATTR = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+
+# Separates cookie names so a pattern can only match at the start of a name
+_COOKIE_SEP = "\x00"
+
+
+def _trie(patterns: Iterable[str]) -> Dict[str, Any]:
+    root: Dict[str, Any] = {}
+    for pattern in patterns:
+        node = root
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return root
+
+
+def _trie_regex(node: Mapping[str, Any]) -> str:
+    """Alternation with shared prefixes factored out, e.g. jquery(?:-ui)?"""
+    branches = [re.escape(char) + _trie_regex(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+
+class _LiteralMatcher:
+    """Finds which of many literal patterns occur in a text, in one scan"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = sorted(set(patterns))
+        self._automaton = None
+        self._regex = None
+        if not self.patterns:
+            return
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for pattern in self.patterns:
+                self._automaton.add_word(pattern, pattern)
+            self._automaton.make_automaton()
+        else:
+            self._root = _trie(self.patterns)
+            # Lookahead so overlapping occurrences are all seen
+            self._regex = re.compile("(?=(" + _trie_regex(self._root) + "))")
+
+    def scan(self, text: str) -> Set[str]:
+        if self._automaton is not None:
+            return {pattern for _, pattern in self._automaton.iter(text)}
+        found: Set[str] = set()
+        if self._regex is None:
+            return found
+        for match in self._regex.finditer(text):
+            # The regex reports the longest pattern at this position; shorter ones are its prefixes
+            node = self._root
+            for index, char in enumerate(match.group(1), 1):
+                node = node[char]
+                if "" in node:
+                    found.add(match.group(1)[:index])
+        return found
+
+
+def load_signatures(path: str = SIGNATURES_PATH) -> Dict[str, Dict[str, Any]]:
+    with open(path, encoding="utf-8") as handle:
+        signatures = json.load(handle)
+    for name, signature in signatures.items():
+        unknown = set(signature) - set(SOURCES) - {"category"}
+        if unknown:
+            raise ValueError(f"Signature {name!r}: unknown keys {sorted(unknown)}")
+    return signatures
+
+
+class TechFingerprinter:
+    """
+    Compiled signature DB. detect() scans the document once per source
+    (html, script srcs, meta values, header values, cookie names).
+    """
+
+    def __init__(self, signatures: Mapping[str, Mapping[str, Any]]):
+        self.categories = {name: signature.get("category", "other") for name, signature in signatures.items()}
+
+        # pattern -> technologies, per source (and per header / meta name)
+        html: Dict[str, Set[str]] = defaultdict(set)
+        scripts: Dict[str, Set[str]] = defaultdict(set)
+        cookies: Dict[str, Set[str]] = defaultdict(set)
+        headers: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        meta: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._header_present: Dict[str, Set[str]] = defaultdict(set)
+
+        for name, signature in signatures.items():
+            for pattern in signature.get("html", []):
+                html[pattern.lower()].add(name)
+            for pattern in signature.get("scripts", []):
+                scripts[pattern.lower()].add(name)
+            for pattern in signature.get("cookies", []):
+                cookies[_COOKIE_SEP + pattern.lower()].add(name)
+            for header, patterns in signature.get("headers", {}).items():
+                for pattern in patterns:
+                    if pattern:
+                        headers[header.lower()][pattern.lower()].add(name)
+                    else:
+                        self._header_present[header.lower()].add(name)
+            for meta_name, patterns in signature.get("meta", {}).items():
+                for pattern in patterns:
+                    meta[meta_name.lower()][pattern.lower()].add(name)
+
+        self._html = (_LiteralMatcher(html), dict(html))
+        self._scripts = (_LiteralMatcher(scripts), dict(scripts))
+        self._cookies = (_LiteralMatcher(cookies), dict(cookies))
+        self._headers = {header: (_LiteralMatcher(table), dict(table)) for header, table in headers.items()}
+        self._meta = {meta_name: (_LiteralMatcher(table), dict(table)) for meta_name, table in meta.items()}
+
+        self.pattern_count = (
+            len(html) + len(scripts) + len(cookies)
+            + sum(len(table) for table in headers.values())
+            + sum(len(table) for table in meta.values())
+            + sum(len(names) for names in self._header_present.values())
+        )
+
+    @classmethod
+    def from_file(cls, path: str = SIGNATURES_PATH) -> "TechFingerprinter":
+        return cls(load_signatures(path))
+
+    def detect(self, html: str, headers: Mapping[str, str], cookies: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """Detected technologies, each with the sources that matched"""
+        evidence: Dict[str, Set[str]] = defaultdict(set)
+
+        def hit(table, text: str, source: str):
+            matcher, techs = table
+            for pattern in matcher.scan(text):
+                for name in techs[pattern]:
+                    evidence[name].add(source)
+
+        html_lower = html.lower()
+        hit(self._html, html_lower, "html")
+
+        script_srcs: List[str] = []
+        for tag, attr_text in _TAG.findall(html_lower):
+            attrs = {key: a or b or c for key, a, b, c in _ATTR.findall(attr_text)}
+            if tag == "script":
+                if attrs.get("src"):
+                    script_srcs.append(attrs["src"])
+            else:
+                meta_name = attrs.get("name") or attrs.get("property")
+                if meta_name in self._meta:
+                    hit(self._meta[meta_name], attrs.get("content", ""), "meta")
+        hit(self._scripts, "\n".join(script_srcs), "scripts")
+
+        for header, value in headers.items():
+            header = header.lower()
+            for name in self._header_present.get(header, ()):
+                evidence[name].add("headers")
+            if header in self._headers:
+                hit(self._headers[header], str(value).lower(), "headers")
+
+        cookie_names = "".join(_COOKIE_SEP + cookie.lower() for cookie in cookies)
+        hit(self._cookies, cookie_names, "cookies")
+
+        return [
+            {"name": name, "category": self.categories[name], "evidence": sorted(sources)}
+            for name, sources in sorted(evidence.items())
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "signatures": len(self.categories),
+            "patterns": self.pattern_count,
+            "matcher": "aho-corasick" if AHOCORASICK_AVAILABLE else "trie-regex",
+        }
@@ -0,0 +1,38 @@
+"""
+_fetch_page: streamed fetch against a local aiohttp server
+
+Run from .local-python-api:
+    python -m pytest -q tests
+"""
+
+import asyncio
+
+from aiohttp import web
+
+import main
+from main import _fetch_page
+
+BODY = "<html><head><title>t</title></head><body>" + "x" * 200_000 + "</body></html>"
+
+
+async def _serve_and_fetch():
+    app = web.Application()
+    app.router.add_get("/", lambda request: web.Response(text=BODY, content_type="text/html"))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        return await _fetch_page(f"http://127.0.0.1:{port}/")
+    finally:
+        await main._shutdown_http_session()
+        await runner.cleanup()
+
+
+def test_streamed_body_is_counted_in_timing():
+    snapshot = asyncio.run(_serve_and_fetch())
+    assert snapshot.html == BODY
+    assert snapshot.truncated is None
+    assert snapshot.timing["bytes"] == len(BODY.encode())
+    assert snapshot.timing["transfer_rate"]
@@ -0,0 +1,96 @@
+"""
+_SingleFlight: shared in-flight analyses
+
+Run from .local-python-api:
+    python -m pytest -q tests
+"""
+
+import asyncio
+
+from main import _SingleFlight
+
+
+def test_concurrent_callers_share_one_task():
+    async def scenario():
+        flight = _SingleFlight()
+        runs = []
+
+        async def work():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return "report"
+
+        results = await asyncio.gather(flight.run("k", work), flight.run("k", work))
+        return results, runs, flight.snapshot()
+
+    results, runs, snapshot = asyncio.run(scenario())
+    assert results == ["report", "report"]
+    assert len(runs) == 1
+    assert snapshot["merged"] == 1 and snapshot["in_flight"] == 0
+
+
+def test_one_waiter_leaving_does_not_cancel_the_others():
+    async def scenario():
+        flight = _SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "report"
+
+        first = asyncio.ensure_future(flight.run("k", work))
+        second = asyncio.ensure_future(flight.run("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, flight.snapshot()
+
+    result, snapshot = asyncio.run(scenario())
+    assert result == "report"
+    assert snapshot["abandoned"] == 0
+
+
+def test_last_waiter_leaving_cancels_the_task():
+    async def scenario():
+        flight = _SingleFlight()
+        cancelled = []
+
+        async def work():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+
+        try:
+            await asyncio.wait_for(flight.run("k", work), timeout=0.01)
+        except asyncio.TimeoutError:
+            pass
+        await asyncio.sleep(0)
+        return cancelled, flight.snapshot()
+
+    cancelled, snapshot = asyncio.run(scenario())
+    assert cancelled == [1]
+    assert snapshot["abandoned"] == 1 and snapshot["in_flight"] == 0
+
+
+def test_caller_joining_as_the_last_waiter_leaves_gets_a_fresh_task():
+    """The first caller is cancelled and a second arrives in the same loop tick"""
+    async def scenario():
+        flight = _SingleFlight()
+        runs = []
+
+        async def work():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return "report"
+
+        first = asyncio.ensure_future(flight.run("k", work))
+        await asyncio.sleep(0)  # first is now waiting on the shared task
+        first.cancel()
+        await asyncio.sleep(0)  # first's finally runs: last waiter gone, task cancelled
+        second = await flight.run("k", work)
+        return second, runs, flight.snapshot()
+
+    result, runs, snapshot = asyncio.run(scenario())
+    assert result == "report"
+    assert len(runs) == 2
+    assert snapshot["started"] == 2 and snapshot["merged"] == 0
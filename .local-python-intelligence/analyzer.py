@@ -17,11 +17,17 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import networkx as nx
 from collections import defaultdict, Counter
+import os
 import re
 import ast
 from datetime import datetime
 from core import ARCOIntelligenceCore, DocumentationQuality, ComponentMaturity
 
+# Módulos compartilhados com a API e os scripts (pip install -e .local-python-scripts)
+from arco_shared.source_scan import get_scan_cache
+from arco_shared.ts_resolver import ImportResolver
+from graph_metrics import compute_centrality, get_centrality_cache
+
 class ARCOAdvancedAnalyzer:
     """Sistema avançado de análise para insights profundos sobre a arquitetura ARCO"""
     
@@ -42,50 +48,42 @@ class ARCOAdvancedAnalyzer:
     def analyze_component_dependencies(self) -> Dict[str, Any]:
         """Análise de dependências entre componentes usando AST parsing"""
         dependency_graph = nx.DiGraph()
-        component_files = list(self.project_root.glob("src/**/*.tsx"))
+        # Só arquivos alterados desde a última execução são reprocessados
+        scanned = get_scan_cache(self.project_root).scan_tree("src/**/*.tsx", base=self.project_root)
         
         import_patterns = defaultdict(list)
         complexity_scores = {}
+        # Imports resolvidos como o tsc/bundler (aliases do tsconfig, index, extensões)
+        resolver = ImportResolver(self.project_root)
         
-        for file_path in component_files:
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                
-                # Análise de imports
-                imports = re.findall(r'import.*from [\'"]([^\'\"]+)[\'"]', content)
-                relative_imports = [imp for imp in imports if imp.startswith('.')]
-                
-                # Análise de complexidade real
-                lines = content.split('\n')
-                non_empty_lines = [line for line in lines if line.strip() and not line.strip().startswith('//')]
-                
-                # Contagem de hooks, props, estados
-                hooks_count = len(re.findall(r'use[A-Z]\w+', content))
-                props_count = len(re.findall(r'interface \w+Props', content))
-                state_count = len(re.findall(r'useState|useReducer', content))
-                
-                complexity_score = len(non_empty_lines) + hooks_count * 2 + props_count * 3 + state_count * 2
-                
-                component_name = file_path.stem
-                dependency_graph.add_node(component_name, 
-                                        path=str(file_path),
-                                        complexity=complexity_score,
-                                        imports=len(imports),
-                                        hooks=hooks_count)
-                
-                # Adiciona edges para dependências
-                for imp in relative_imports:
-                    dependency_graph.add_edge(component_name, imp.replace('./', '').replace('../', ''))
-                
-                import_patterns[component_name] = imports
-                complexity_scores[component_name] = complexity_score
-                
-            except Exception as e:
-                continue
+        for file_path, metrics in scanned.items():
+            imports = metrics['imports']
+            hooks_count = metrics['hooks']
+            
+            complexity_score = metrics['code_lines'] + hooks_count * 2 + metrics['props'] * 3 + metrics['state_hooks'] * 2
+            
+            # Caminho relativo sem extensão: único mesmo com dezenas de page.tsx
+            component_name = self._module_id(file_path)
+            dependency_graph.add_node(component_name, 
+                                    name=file_path.stem,
+                                    path=str(file_path),
+                                    complexity=complexity_score,
+                                    imports=len(imports),
+                                    hooks=hooks_count)
+            
+            # Adiciona edges para dependências internas (pacotes externos ficam de fora)
+            for imp in imports:
+                target = resolver.resolve(imp, file_path)
+                if target is not None:
+                    dependency_graph.add_edge(component_name, self._module_id(target))
+            
+            import_patterns[component_name] = imports
+            complexity_scores[component_name] = complexity_score
         
-        # Análise de centralidade e importância
-        centrality = nx.degree_centrality(dependency_graph)
-        betweenness = nx.betweenness_centrality(dependency_graph)
+        # Análise de centralidade e importância (CSR + betweenness por pivôs em grafos grandes, cache por hash)
+        scores = compute_centrality(dependency_graph, get_centrality_cache(self.project_root))
+        centrality = scores['degree']
+        betweenness = scores['betweenness']
         
         # Converte grafo para formato serializável
         graph_data = {
@@ -94,7 +92,10 @@ class ARCOAdvancedAnalyzer:
             'metrics': {
                 'total_nodes': dependency_graph.number_of_nodes(),
                 'total_edges': dependency_graph.number_of_edges(),
-                'density': nx.density(dependency_graph) if dependency_graph.number_of_nodes() > 0 else 0
+                'density': nx.density(dependency_graph) if dependency_graph.number_of_nodes() > 0 else 0,
+                'graph_hash': scores['graph_hash'],
+                'betweenness_method': scores['betweenness_method'],
+                'betweenness_pivots': scores['betweenness_pivots']
             }
         }
         
@@ -102,11 +103,21 @@ class ARCOAdvancedAnalyzer:
             'dependency_graph_data': graph_data,
             'centrality_scores': centrality,
             'betweenness_scores': betweenness,
+            'pagerank_scores': scores['pagerank'],
             'complexity_distribution': complexity_scores,
             'import_patterns': dict(import_patterns),
             'critical_components': self._identify_critical_components(centrality, betweenness, complexity_scores)
         }
     
+    def _module_id(self, path: Path) -> str:
+        """Id do módulo no grafo: caminho relativo ao projeto, sem extensão"""
+        path = Path(os.path.abspath(path))
+        try:
+            path = path.relative_to(os.path.abspath(self.project_root))
+        except ValueError:
+            pass
+        return path.with_suffix('').as_posix()
+    
     def _identify_critical_components(self, centrality: Dict, betweenness: Dict, complexity: Dict) -> List[Dict]:
         """Identifica componentes críticos baseado em métricas de rede"""
         components = []
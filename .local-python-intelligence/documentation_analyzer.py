@@ -9,7 +9,9 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 from dataclasses import dataclass, asdict
 import markdown
-from bs4 import BeautifulSoup
+
+# Parser HTML de passada única compartilhado com a API (pip install -e .local-python-scripts)
+from arco_shared.html_digest import digest_html
 
 @dataclass
 class DocumentationMetrics:
@@ -46,8 +48,7 @@ class DocumentationIntelligence:
         
         # Converte markdown para texto limpo
         html = markdown.markdown(content)
-        soup = BeautifulSoup(html, 'html.parser')
-        clean_text = soup.get_text().lower()
+        clean_text = digest_html(html).text.lower()
         
         # Business Value Score
         value_keywords = sum(1 for keyword in self.business_keywords['value_proposition'] 
@@ -0,0 +1,168 @@
+"""
+ARCO Intelligence - Centralidade escalável para o grafo de dependências
+
+- degree e PageRank calculados sobre a matriz de adjacência esparsa (SciPy CSR)
+- betweenness exata em grafos pequenos; acima do limite, aproximação por
+  k pivôs (nx.betweenness_centrality(G, k=..., seed=...)), erro ~ 1/sqrt(k)
+- resultados guardados por hash do grafo: árvore sem mudanças = zero cálculo
+
+Env:
+    ARCO_BETWEENNESS_EXACT_MAX  nós até onde a betweenness é exata (default 2000)
+    ARCO_BETWEENNESS_PIVOTS     pivôs da aproximação (default 128)
+    ARCO_BETWEENNESS_SEED       semente dos pivôs, resultado reprodutível (default 42)
+    ARCO_CENTRALITY_CACHE       diretório do cache (default <root>/.arco-cache/centrality,
+                                "off" = só em memória)
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+# Bump quando o cálculo mudar - entradas antigas do cache são ignoradas
+CENTRALITY_VERSION = 1
+
+BETWEENNESS_EXACT_MAX = int(os.getenv("ARCO_BETWEENNESS_EXACT_MAX", "2000"))
+BETWEENNESS_PIVOTS = int(os.getenv("ARCO_BETWEENNESS_PIVOTS", "128"))
+BETWEENNESS_SEED = int(os.getenv("ARCO_BETWEENNESS_SEED", "42"))
+
+
+def graph_hash(graph: nx.DiGraph) -> str:
+    """Hash estável da estrutura (nós e arestas, independente da ordem de inserção)"""
+    digest = hashlib.sha256()
+    for node in sorted(map(str, graph.nodes)):
+        digest.update(node.encode("utf-8") + b"\x00")
+    digest.update(b"\x01")
+    for source, target in sorted((str(u), str(v)) for u, v in graph.edges):
+        digest.update(source.encode("utf-8") + b"\x00" + target.encode("utf-8") + b"\x00")
+    return digest.hexdigest()
+
+
+def degree_centrality_csr(adjacency: sparse.csr_matrix) -> np.ndarray:
+    """(grau de entrada + saída) / (n - 1), igual a nx.degree_centrality"""
+    n = adjacency.shape[0]
+    if n <= 1:
+        return np.ones(n)
+    binary = adjacency.astype(bool)
+    degree = np.asarray(binary.sum(axis=0)).ravel() + np.asarray(binary.sum(axis=1)).ravel()
+    return degree / (n - 1)
+
+
+def pagerank_csr(adjacency: sparse.csr_matrix, alpha: float = 0.85,
+                 max_iter: int = 100, tol: float = 1.0e-6) -> np.ndarray:
+    """Power iteration sobre a matriz de transição esparsa (mesma convenção de nx.pagerank)"""
+    n = adjacency.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    out_degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = out_degree == 0
+    inverse = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+    transition = sparse.diags(inverse) @ adjacency  # linhas normalizadas
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = rank
+        rank = alpha * (previous @ transition + previous[dangling].sum() / n) + (1 - alpha) / n
+        if np.abs(rank - previous).sum() < n * tol:
+            break
+    return rank / rank.sum()
+
+
+def betweenness(graph: nx.DiGraph) -> Dict[str, Any]:
+    """Betweenness exata ou por k pivôs, conforme o tamanho do grafo"""
+    n = graph.number_of_nodes()
+    if n <= BETWEENNESS_EXACT_MAX or BETWEENNESS_PIVOTS >= n:
+        return {"scores": nx.betweenness_centrality(graph), "method": "exact", "pivots": n}
+    scores = nx.betweenness_centrality(graph, k=BETWEENNESS_PIVOTS, seed=BETWEENNESS_SEED)
+    return {"scores": scores, "method": "k-pivot", "pivots": BETWEENNESS_PIVOTS}
+
+
+class CentralityCache:
+    """Métricas de centralidade por hash do grafo, em memória e em JSON no disco"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, digest: str) -> str:
+        # Parâmetros da aproximação fazem parte da chave
+        return f"{digest[:32]}-v{CENTRALITY_VERSION}-{BETWEENNESS_EXACT_MAX}-{BETWEENNESS_PIVOTS}-{BETWEENNESS_SEED}"
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        key = self._key(digest)
+        if key in self._memory:
+            return self._memory[key]
+        if self.cache_dir is not None:
+            try:
+                with open(self.cache_dir / f"{key}.json", "r", encoding="utf-8") as f:
+                    self._memory[key] = json.load(f)
+                    return self._memory[key]
+            except (OSError, ValueError):
+                pass
+        return None
+
+    def put(self, digest: str, result: Dict[str, Any]):
+        key = self._key(digest)
+        self._memory[key] = result
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp = self.cache_dir / f"{key}.json.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(result, f)
+                os.replace(tmp, self.cache_dir / f"{key}.json")
+            except OSError:
+                pass  # cache é opcional
+
+
+_caches: Dict[str, CentralityCache] = {}
+
+
+def get_centrality_cache(root: str = ".") -> CentralityCache:
+    root = os.path.abspath(root)
+    if root not in _caches:
+        cache_dir = os.getenv("ARCO_CENTRALITY_CACHE") or os.path.join(root, ".arco-cache", "centrality")
+        _caches[root] = CentralityCache(None if cache_dir == "off" else cache_dir)
+    return _caches[root]
+
+
+def compute_centrality(graph: nx.DiGraph, cache: Optional[CentralityCache] = None) -> Dict[str, Any]:
+    """
+    degree, pagerank e betweenness por nó, mais o método usado.
+    Grafo idêntico a uma execução anterior sai direto do cache.
+    """
+    digest = graph_hash(graph)
+    if cache is not None:
+        cached = cache.get(digest)
+        if cached is not None:
+            cache.hits += 1
+            return cached
+        cache.misses += 1
+
+    nodes = list(graph.nodes)
+    if nodes:
+        adjacency = sparse.csr_matrix(nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format="csr", dtype=float))
+    else:
+        adjacency = sparse.csr_matrix((0, 0))
+    degree = degree_centrality_csr(adjacency)
+    pagerank = pagerank_csr(adjacency)
+    between = betweenness(graph)
+
+    result = {
+        "graph_hash": digest,
+        "degree": {str(node): float(value) for node, value in zip(nodes, degree)},
+        "pagerank": {str(node): float(value) for node, value in zip(nodes, pagerank)},
+        "betweenness": {str(node): float(value) for node, value in between["scores"].items()},
+        "betweenness_method": between["method"],
+        "betweenness_pivots": between["pivots"],
+    }
+    if cache is not None:
+        cache.put(digest, result)
+    return result
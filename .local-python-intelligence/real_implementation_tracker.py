@@ -11,6 +11,9 @@ from typing import Dict, List, Any
 from datetime import datetime
 import shutil
 
+# Cache de métricas por arquivo compartilhado com os scripts (pip install -e .local-python-scripts)
+from arco_shared.source_scan import get_scan_cache
+
 class ARCORealImplementationTracker:
     """Sistema de implementação real baseado na análise de intelligence"""
     
@@ -215,19 +218,17 @@ class ARCORealImplementationTracker:
             }
         
         component_file = component_files[0]
-        content = component_file.read_text(encoding='utf-8')
+        metrics = get_scan_cache(self.project_root).scan(component_file)
         
         # Análise real de complexidade
-        lines = content.split('\n')
-        non_empty_lines = [line for line in lines if line.strip() and not line.strip().startswith('//')]
-        actual_complexity = len(non_empty_lines)
+        actual_complexity = metrics['code_lines']
         
         # Identifica áreas para simplificação
         complexity_sources = {
-            'long_functions': len([line for line in lines if 'function' in line or '=>' in line]),
-            'nested_conditions': len([line for line in lines if '&&' in line or '||' in line]),
-            'inline_styles': len([line for line in lines if 'style={{' in line]),
-            'complex_jsx': len([line for line in lines if line.count('<') > 2])
+            'long_functions': metrics['function_lines'],
+            'nested_conditions': metrics['condition_lines'],
+            'inline_styles': metrics['inline_style_lines'],
+            'complex_jsx': metrics['complex_jsx_lines']
         }
         
         return {
@@ -10,13 +10,15 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass, asdict
-import re
 import ast
 from datetime import datetime
 import shutil
 import subprocess
 from collections import defaultdict, Counter
 
+# Cache de métricas por arquivo compartilhado com os scripts (pip install -e .local-python-scripts)
+from arco_shared.source_scan import get_scan_cache
+
 @dataclass
 class AtomicHierarchy:
     """Hierarquia atômica S-tier para organização sistemática"""
@@ -393,34 +395,28 @@ class ARCOSTierConsolidator:
         """Analisa componentes existentes para classificação atômica"""
         components = []
         
-        # Busca todos os componentes .tsx
-        for tsx_file in self.src_path.glob("**/*.tsx"):
-            try:
-                content = tsx_file.read_text(encoding='utf-8')
-                
-                # Análise de complexidade e função
-                lines_count = len([l for l in content.split('\n') if l.strip() and not l.strip().startswith('//')])
-                props_count = len(re.findall(r'interface \w+Props', content))
-                hooks_count = len(re.findall(r'use[A-Z]\w+', content))
-                jsx_complexity = len(re.findall(r'<\w+', content))
-                
-                components.append({
-                    'name': tsx_file.stem,
-                    'path': str(tsx_file.relative_to(self.src_path)),
-                    'lines': lines_count,
-                    'props': props_count,
-                    'hooks': hooks_count,
-                    'jsx_elements': jsx_complexity,
-                    'complexity_score': lines_count + props_count * 2 + hooks_count * 1.5 + jsx_complexity * 0.5,
-                    'type_hint': self._classify_component_type(tsx_file.stem, content)
-                })
-                
-            except Exception:
-                continue
+        # Busca todos os componentes .tsx (só os alterados são reprocessados)
+        scanned = get_scan_cache(self.project_root).scan_tree("**/*.tsx", base=self.src_path)
+        for tsx_file, metrics in scanned.items():
+            lines_count = metrics['code_lines']
+            props_count = metrics['props']
+            hooks_count = metrics['hooks']
+            jsx_complexity = metrics['jsx_elements']
+            
+            components.append({
+                'name': tsx_file.stem,
+                'path': str(tsx_file.relative_to(self.src_path)),
+                'lines': lines_count,
+                'props': props_count,
+                'hooks': hooks_count,
+                'jsx_elements': jsx_complexity,
+                'complexity_score': lines_count + props_count * 2 + hooks_count * 1.5 + jsx_complexity * 0.5,
+                'type_hint': self._classify_component_type(tsx_file.stem, metrics['total_lines'])
+            })
         
         return components
     
-    def _classify_component_type(self, name: str, content: str) -> str:
+    def _classify_component_type(self, name: str, total_lines: int) -> str:
         """Classifica tipo de componente baseado em nome e conteúdo"""
         name_lower = name.lower()
         
@@ -446,7 +442,7 @@ class ARCOSTierConsolidator:
         
         # Classificação por complexidade se nome não for claro
         else:
-            complexity = len(content.split('\n'))
+            complexity = total_lines
             if complexity < 50:
                 return 'atom'
             elif complexity < 150:
@@ -0,0 +1,16 @@
+"""
+ARCO - Shared Python modules
+Used by the Intelligence API, the intelligence analyzers and the CLI scripts
+
+    dns_cache     TTL-aware caching DNS resolver
+    whois_store   WHOIS record store (single-flight, stale-while-revalidate)
+    tls_probe     cached TLS handshake probe
+    html_digest   one-pass HTML parse for the content analyzers
+    source_scan   incremental per-file TSX metrics cache
+    ts_resolver   TypeScript import resolver (tsconfig paths)
+
+Scripts in .local-python-scripts import it as-is (their directory is on
+sys.path). Everything else installs it once:
+
+    pip install -e .local-python-scripts
+"""
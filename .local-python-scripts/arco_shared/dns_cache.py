@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+ARCO - Caching DNS Resolver
+Shared by the Intelligence API and the CLI scripts
+
+- Honors record TTLs (entries expire with the smallest TTL in the answer)
+- Caches negative answers (NXDOMAIN / NoAnswer) using the zone's SOA minimum
+- In-process LRU, plus an optional SQLite file so separate CLI runs share warm entries
+- Hit/miss counters via stats()
+
+Usage:
+    from arco_shared.dns_cache import get_resolver
+
+    answer = get_resolver().resolve("example.com", "MX")        # blocking
+    answer = await get_resolver().aresolve("example.com", "MX")  # asyncio
+
+    for mx in answer:
+        print(mx.preference, mx.exchange)
+    print(answer.ttl)  # seconds left before the entry expires
+
+Env:
+    ARCO_DNS_CACHE_DB           SQLite file (unset = memory only)
+    ARCO_DNS_CACHE_MAX_ENTRIES  LRU size (default 10000)
+    ARCO_DNS_NEGATIVE_TTL       negative TTL when the response has no SOA (default 300)
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import dns.asyncresolver
+import dns.name
+import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
+import dns.resolver
+
+# Entry kinds
+POSITIVE = "answer"
+NXDOMAIN = "nxdomain"
+NOANSWER = "noanswer"
+
+# (kind, rdata texts, expires_at wall clock)
+Entry = Tuple[str, List[str], float]
+
+
+class CachedAnswer:
+    """Iterable of rdata objects with the remaining TTL, like a trimmed-down dns.resolver.Answer"""
+
+    def __init__(self, name: str, rdtype: str, rdatas: List, ttl: float, from_cache: bool):
+        self.name = name
+        self.rdtype = rdtype
+        self.rdatas = rdatas
+        self.ttl = ttl
+        self.from_cache = from_cache
+
+    def __iter__(self):
+        return iter(self.rdatas)
+
+    def __len__(self):
+        return len(self.rdatas)
+
+    def __getitem__(self, index):
+        return self.rdatas[index]
+
+
+class CachingResolver:
+    def __init__(self, max_entries: int = 10000, db_path: Optional[str] = None,
+                 negative_ttl: float = 300.0, min_ttl: float = 0.0, max_ttl: float = 86400.0):
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[Tuple[str, str], Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._counters = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "disk_hits": 0,
+            "evictions": 0,
+        }
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=5)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS dns_cache ("
+                "name TEXT NOT NULL, rdtype TEXT NOT NULL, kind TEXT NOT NULL, "
+                "records TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (name, rdtype))"
+            )
+            self._db.commit()
+
+    def resolve(self, name: str, rdtype: str = "A", lifetime: Optional[float] = None) -> CachedAnswer:
+        """Blocking lookup; raises dns.resolver.NXDOMAIN / NoAnswer for (cached) negative answers"""
+        key = self._key(name, rdtype)
+        cached = self._lookup(key, use_disk=True)
+        if cached is not None:
+            return self._answer(key, cached, from_cache=True)
+
+        resolver = dns.resolver.Resolver()
+        if lifetime is not None:
+            resolver.lifetime = lifetime
+        return self._store_result(key, lambda: resolver.resolve(key[0], key[1]))
+
+    async def aresolve(self, name: str, rdtype: str = "A", lifetime: Optional[float] = None) -> CachedAnswer:
+        """asyncio lookup; the SQLite tier is read off the event loop"""
+        key = self._key(name, rdtype)
+        cached = self._lookup(key, use_disk=False, count_miss=self._db is None)
+        if cached is None and self._db is not None:
+            cached = await asyncio.to_thread(self._lookup, key, True)
+        if cached is not None:
+            return self._answer(key, cached, from_cache=True)
+
+        resolver = dns.asyncresolver.Resolver()
+        if lifetime is not None:
+            resolver.lifetime = lifetime
+        try:
+            answer = await resolver.resolve(key[0], key[1])
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            entry = self._negative_entry(e)
+            await self._persist_async(key, entry)
+            raise
+        entry = self._positive_entry(answer)
+        await self._persist_async(key, entry)
+        return self._answer(key, entry, from_cache=False)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and cache size"""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["negative_hits"] + self._counters["misses"]
+            hits = self._counters["hits"] + self._counters["negative_hits"]
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "persistent": self._db is not None,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM dns_cache")
+                self._db.commit()
+
+    @staticmethod
+    def _key(name: str, rdtype: str) -> Tuple[str, str]:
+        return name.strip().lower().rstrip("."), rdtype.upper()
+
+    def _lookup(self, key: Tuple[str, str], use_disk: bool, count_miss: bool = True) -> Optional[Entry]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > now:
+                self._entries.move_to_end(key)
+                self._count_hit(entry)
+                return entry
+            if entry is not None:
+                del self._entries[key]
+
+            if use_disk and self._db is not None:
+                row = self._db.execute(
+                    "SELECT kind, records, expires_at FROM dns_cache WHERE name = ? AND rdtype = ?",
+                    key
+                ).fetchone()
+                if row is not None and row[2] > now:
+                    entry = (row[0], json.loads(row[1]), row[2])
+                    self._remember(key, entry)
+                    self._counters["disk_hits"] += 1
+                    self._count_hit(entry)
+                    return entry
+
+            if count_miss:
+                self._counters["misses"] += 1
+            return None
+
+    def _count_hit(self, entry: Entry):
+        self._counters["hits" if entry[0] == POSITIVE else "negative_hits"] += 1
+
+    def _answer(self, key: Tuple[str, str], entry: Entry, from_cache: bool) -> CachedAnswer:
+        kind, records, expires_at = entry
+        if kind == NXDOMAIN:
+            raise dns.resolver.NXDOMAIN(qnames=[dns.name.from_text(key[0])], responses={})
+        if kind == NOANSWER:
+            raise dns.resolver.NoAnswer()
+        rdtype = dns.rdatatype.from_text(key[1])
+        rdatas = [dns.rdata.from_text(dns.rdataclass.IN, rdtype, text) for text in records]
+        return CachedAnswer(key[0], key[1], rdatas, max(0.0, expires_at - time.time()), from_cache)
+
+    def _clamp(self, ttl: float) -> float:
+        return min(max(ttl, self.min_ttl), self.max_ttl)
+
+    def _positive_entry(self, answer) -> Entry:
+        records = [rdata.to_text() for rdata in answer]
+        ttl = answer.rrset.ttl if answer.rrset is not None else self.negative_ttl
+        return POSITIVE, records, time.time() + self._clamp(ttl)
+
+    def _negative_entry(self, error: Exception) -> Entry:
+        kind = NXDOMAIN if isinstance(error, dns.resolver.NXDOMAIN) else NOANSWER
+        return kind, [], time.time() + self._clamp(self._soa_minimum(error))
+
+    def _soa_minimum(self, error: Exception) -> float:
+        """RFC 2308: negative answers live for min(SOA TTL, SOA MINIMUM)"""
+        try:
+            if isinstance(error, dns.resolver.NXDOMAIN):
+                responses = list(error.responses().values())
+            else:
+                responses = [error.kwargs.get("response")]
+            for response in responses:
+                for rrset in getattr(response, "authority", []):
+                    if rrset.rdtype == dns.rdatatype.SOA:
+                        return float(min(rrset.ttl, rrset[0].minimum))
+        except Exception:
+            pass
+        return self.negative_ttl
+
+    def _store_result(self, key: Tuple[str, str], query) -> CachedAnswer:
+        try:
+            answer = query()
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            self._persist(key, self._negative_entry(e))
+            raise
+        entry = self._positive_entry(answer)
+        self._persist(key, entry)
+        return self._answer(key, entry, from_cache=False)
+
+    async def _persist_async(self, key: Tuple[str, str], entry: Entry):
+        if self._db is None:
+            self._persist(key, entry)
+        else:
+            await asyncio.to_thread(self._persist, key, entry)
+
+    def _persist(self, key: Tuple[str, str], entry: Entry):
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO dns_cache (name, rdtype, kind, records, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key[0], key[1], entry[0], json.dumps(entry[1]), entry[2])
+                )
+                self._db.commit()
+
+    def _remember(self, key: Tuple[str, str], entry: Entry):
+        """Memory LRU insert; caller holds the lock"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+
+_default_resolver: Optional[CachingResolver] = None
+_default_lock = threading.Lock()
+
+
+def get_resolver() -> CachingResolver:
+    """Process-wide resolver configured from the environment"""
+    global _default_resolver
+    with _default_lock:
+        if _default_resolver is None:
+            _default_resolver = CachingResolver(
+                max_entries=int(os.getenv("ARCO_DNS_CACHE_MAX_ENTRIES", "10000")),
+                db_path=os.getenv("ARCO_DNS_CACHE_DB") or None,
+                negative_ttl=float(os.getenv("ARCO_DNS_NEGATIVE_TTL", "300")),
+            )
+        return _default_resolver
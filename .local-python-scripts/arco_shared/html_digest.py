@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+ARCO - HTML Digest
+Shared by the Intelligence API and the documentation analyzer
+
+One pass over a document collects everything the content analyzers used to
+get from a BeautifulSoup tree plus a find_all() per tag and a get_text():
+title, meta tags, per-tag counts (h1..h6, p, img, a, ...) and visible text.
+
+Backends (pluggable, fastest installed one is the default):
+- selectolax  Lexbor/Modest C parser, tree walked once
+- lxml        libxml2 parser driving the visitor directly (no tree is built)
+- html.parser stdlib streaming parser, always available
+
+Usage:
+    from arco_shared.html_digest import digest_html
+
+    digest = digest_html(html)                      # default backend
+    digest = digest_html(html, backend="lxml")
+    digest.headings()    # {"h1": 1, "h2": 4, ...}
+    digest.count("img")
+    digest.meta.get("description")
+    digest.text
+
+Env:
+    ARCO_HTML_BACKEND   force a backend (selectolax, lxml, html.parser)
+"""
+
+import os
+from collections import Counter
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Mapping, Optional
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Text inside these never reaches the reader
+_INVISIBLE = frozenset({"script", "style", "noscript", "template"})
+
+
+class PageDigest:
+    """Everything the content analyzers need from one document"""
+
+    def __init__(self, title: str, meta: Dict[str, str], tags: Counter, text: str):
+        self.title = title
+        self.meta = meta
+        self.tags = tags
+        self.text = text
+
+    def count(self, tag: str) -> int:
+        return self.tags.get(tag, 0)
+
+    def headings(self) -> Dict[str, int]:
+        return {f"h{i}": self.tags.get(f"h{i}", 0) for i in range(1, 7)}
+
+
+class _Visitor:
+    """Backend-neutral start/end/data callbacks building a PageDigest"""
+
+    def __init__(self):
+        self.tags: Counter = Counter()
+        self.meta: Dict[str, str] = {}
+        self.text_parts: List[str] = []
+        self.title_parts: List[str] = []
+        self._invisible = 0
+        self._in_title = False
+        self._title_done = False
+
+    def start(self, tag: str, attrs: Mapping[str, Optional[str]]):
+        tag = tag.lower()
+        self.tags[tag] += 1
+        if tag in _INVISIBLE:
+            self._invisible += 1
+        elif tag == "title":
+            self._in_title = not self._title_done
+        elif tag == "meta":
+            self.add_meta(attrs)
+
+    def add_meta(self, attrs: Mapping[str, Optional[str]]):
+        key = attrs.get("name") or attrs.get("property") or attrs.get("http-equiv")
+        if key:
+            # First occurrence wins, like soup.find()
+            self.meta.setdefault(key.lower(), attrs.get("content") or "")
+
+    def end(self, tag: str):
+        tag = tag.lower()
+        if tag in _INVISIBLE:
+            self._invisible = max(0, self._invisible - 1)
+        elif tag == "title" and self._in_title:
+            self._in_title = False
+            self._title_done = True
+
+    def data(self, text: str):
+        if self._invisible:
+            return
+        if self._in_title:
+            self.title_parts.append(text)
+        self.text_parts.append(text)
+
+    def close(self) -> PageDigest:
+        return PageDigest(
+            title="".join(self.title_parts),
+            meta=self.meta,
+            tags=self.tags,
+            text="".join(self.text_parts),
+        )
+
+
+class _StdlibParser(HTMLParser):
+    def __init__(self, visitor: _Visitor):
+        super().__init__(convert_charrefs=True)
+        self.visitor = visitor
+
+    def handle_starttag(self, tag, attrs):
+        self.visitor.start(tag, dict(attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        self.visitor.start(tag, dict(attrs))
+        self.visitor.end(tag)
+
+    def handle_endtag(self, tag):
+        self.visitor.end(tag)
+
+    def handle_data(self, data):
+        self.visitor.data(data)
+
+
+def _digest_stdlib(html: str) -> PageDigest:
+    visitor = _Visitor()
+    parser = _StdlibParser(visitor)
+    parser.feed(html)
+    parser.close()
+    return visitor.close()
+
+
+def _digest_lxml(html: str) -> PageDigest:
+    # lxml calls the target's start/end/data/close while parsing - no tree is built
+    visitor = _Visitor()
+    parser = etree.HTMLParser(target=visitor)
+    parser.feed(html)
+    return parser.close()
+
+
+def _digest_selectolax(html: str) -> PageDigest:
+    visitor = _Visitor()
+    root = _SelectolaxParser(html).root
+    if root is None:
+        return visitor.close()
+
+    # traverse() yields elements and text nodes in document order, but no end events,
+    # so invisible subtrees are tracked by node id: text nested deeper than the direct
+    # child (<noscript><a>Enable JS</a></noscript>) stays out, as with the other backends
+    hidden = set()
+    for node in root.traverse(include_text=True):
+        tag = node.tag
+        if tag == "-text":
+            parent = node.parent
+            if parent is None or parent.mem_id not in hidden:
+                visitor.text_parts.append(node.text_content)
+        elif not tag.startswith("-"):
+            if tag in _INVISIBLE or (hidden and node.parent is not None and node.parent.mem_id in hidden):
+                hidden.add(node.mem_id)
+            visitor.tags[tag] += 1
+            if tag == "meta":
+                visitor.add_meta(node.attributes)
+            elif tag == "title" and not visitor._title_done:
+                visitor.title_parts.append(node.text(deep=True))
+                visitor._title_done = True
+    return visitor.close()
+
+
+BACKENDS: Dict[str, Callable[[str], PageDigest]] = {"html.parser": _digest_stdlib}
+if LXML_AVAILABLE:
+    BACKENDS["lxml"] = _digest_lxml
+if SELECTOLAX_AVAILABLE:
+    BACKENDS["selectolax"] = _digest_selectolax
+
+DEFAULT_BACKEND = os.getenv("ARCO_HTML_BACKEND") or next(
+    name for name in ("selectolax", "lxml", "html.parser") if name in BACKENDS
+)
+
+
+def digest_html(html: str, backend: Optional[str] = None) -> PageDigest:
+    """Single-pass digest of a document"""
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"HTML backend {backend!r} not available (installed: {', '.join(BACKENDS)})")
+    if not html:
+        return _Visitor().close()
+    return BACKENDS[backend](html)
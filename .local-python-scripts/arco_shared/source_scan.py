@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+ARCO - Source Scan Cache
+Shared by the intelligence analyzers and the CLI scripts
+
+Per-file TSX metrics (lines, hooks, props, imports, JSX elements, ...) are
+computed once and kept in a SQLite file keyed by path. A file is re-parsed
+only when its content changes:
+- same mtime and size as the cached entry: not even read
+- different mtime/size but same SHA-256 (fresh CI checkout, touch, branch
+  switch back and forth): read and hashed, not parsed
+- otherwise: parsed, and the entry replaced
+So a full analysis costs roughly the size of the diff since the last run.
+
+Files that do need reading are spread over a process pool in chunks; results
+are merged in sorted path order, so output never depends on the worker count.
+
+Usage:
+    from arco_shared.source_scan import get_scan_cache
+
+    cache = get_scan_cache(project_root)
+    for path, metrics in cache.scan_tree("src/**/*.tsx").items():
+        metrics["hooks"], metrics["imports"], ...
+    metrics = cache.scan("src/components/ui/Button.tsx")
+
+Env:
+    ARCO_SCAN_CACHE     SQLite file (default <root>/.arco-cache/source-scan.sqlite,
+                        "off" = memory only)
+    ARCO_SCAN_WORKERS   worker processes for reading/parsing (default: CPU count, 1 = inline)
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Bump when extract_metrics() changes - every cached entry is re-parsed once
+METRICS_VERSION = 1
+
+# Fewer files than this to read are handled inline (pool start-up costs more)
+PARALLEL_MIN_FILES = 256
+
+_IMPORT = re.compile(r'import.*from [\'"]([^\'\"]+)[\'"]')
+_HOOK = re.compile(r'use[A-Z]\w+')
+_PROPS = re.compile(r'interface \w+Props')
+_JSX_ELEMENT = re.compile(r'<\w')
+# "Lines containing X": match the first X and swallow the rest of the line
+_STYLE_LINE = re.compile(r'style=\{\{[^\n]*')
+_COMPLEX_JSX_LINE = re.compile(r'<[^<\n]*<[^<\n]*<[^\n]*')  # 3+ '<'
+_STATE_HOOKS = ('useState', 'useReducer')
+
+
+def extract_metrics(content: str) -> Dict[str, Any]:
+    """
+    Everything the analyzers read from a component source. Each metric uses
+    whichever form is cheapest in CPython (see bench_tsx_metrics.py): regexes
+    that start with a literal, and C-level str methods mapped over one split.
+    """
+    lines = content.split('\n')
+    stripped = list(map(str.strip, lines))
+    hooks = _HOOK.findall(content)
+    return {
+        "total_lines": len(lines),
+        "code_lines": len(stripped) - stripped.count('') - sum(map(str.startswith, stripped, repeat('//'))),
+        "imports": _IMPORT.findall(content),
+        "hooks": len(hooks),
+        "state_hooks": sum(1 for hook in hooks if hook.startswith(_STATE_HOOKS)),
+        "props": len(_PROPS.findall(content)),
+        "jsx_elements": len(_JSX_ELEMENT.findall(content)),
+        # Line-level complexity sources (real_implementation_tracker)
+        "function_lines": len([line for line in lines if 'function' in line or '=>' in line]),
+        "condition_lines": len([line for line in lines if '&&' in line or '||' in line]),
+        "inline_style_lines": len(_STYLE_LINE.findall(content)),
+        "complex_jsx_lines": len(_COMPLEX_JSX_LINE.findall(content)),
+        # Pattern flags (ui-optimization)
+        "features": {
+            "forward_ref": 'forwardRef' in content,
+            "performance_hooks": 'useMemo' in content or 'useCallback' in content,
+            "typescript": ': React.' in content or 'interface ' in content or 'type ' in content,
+            "accessibility": 'aria-' in content or 'role=' in content,
+            "class_names": 'className' in content,
+            "animations": 'framer-motion' in content or 'motion.' in content,
+            "reusable": 'Props' in content and 'export' in content,
+        },
+    }
+
+
+def _decode(data: bytes) -> str:
+    # Universal newlines, like Path.read_text()
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _read_chunk(jobs: List[Tuple[str, Optional[str]]]) -> List[Tuple[str, Optional[str], Optional[Dict[str, Any]]]]:
+    """
+    Worker side: (path, cached sha256) -> (path, sha256, metrics).
+    metrics is None when the hash matched the cache; sha256 is None on a read/decode error.
+    """
+    results = []
+    for path, known_sha256 in jobs:
+        try:
+            data = Path(path).read_bytes()
+            sha256 = hashlib.sha256(data).hexdigest()
+            metrics = None if sha256 == known_sha256 else extract_metrics(_decode(data))
+        except (OSError, UnicodeDecodeError):
+            sha256, metrics = None, None
+        results.append((path, sha256, metrics))
+    return results
+
+
+class SourceScanCache:
+    def __init__(self, root: Union[str, Path], db_path: Optional[str] = None, workers: Optional[int] = None):
+        self.root = Path(os.path.abspath(root))
+        self._root_prefix = os.path.join(str(self.root), "")
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Dict[str, Optional[Dict[str, Any]]] = {}  # path -> entry, None = delete
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._counters = {"unchanged": 0, "rehashed": 0, "parsed": 0, "removed": 0, "errors": 0}
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS source_scan ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha256 TEXT, version INTEGER, metrics TEXT)"
+        )
+        rows = self._db.execute(
+            "SELECT path, mtime_ns, size, sha256, metrics FROM source_scan WHERE version = ?", (METRICS_VERSION,)
+        )
+        for path, mtime_ns, size, sha256, metrics in rows:
+            self._entries[path] = {"mtime_ns": mtime_ns, "size": size, "sha256": sha256, "metrics": json.loads(metrics)}
+
+    def _key(self, path: Union[str, Path]) -> str:
+        # Relative keys, so the cache survives the checkout moving (CI workspaces).
+        # Plain string ops: pathlib is most of the cost of a warm scan.
+        absolute = os.path.abspath(path)
+        if absolute.startswith(self._root_prefix):
+            return absolute[len(self._root_prefix):].replace(os.sep, "/")
+        return absolute
+
+    def scan(self, path: Union[str, Path]) -> Dict[str, Any]:
+        """Metrics for one file (raises OSError if it can't be read)"""
+        path = Path(path)
+        key = self._key(path)
+        stat = path.stat()
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self._counters["unchanged"] += 1
+            return entry["metrics"]
+
+        data = path.read_bytes()
+        sha256 = hashlib.sha256(data).hexdigest()
+        if entry and entry["sha256"] == sha256:
+            self._counters["rehashed"] += 1
+            metrics = entry["metrics"]
+        else:
+            self._counters["parsed"] += 1
+            metrics = extract_metrics(_decode(data))
+
+        entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256, "metrics": metrics}
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty[key] = entry
+        return metrics
+
+    def scan_tree(self, pattern: str = "src/**/*.tsx", base: Optional[Union[str, Path]] = None) -> Dict[Path, Dict[str, Any]]:
+        """
+        Metrics for every file matching pattern under base (default: root),
+        keyed by the paths base.glob() yields. Unreadable files are skipped.
+        """
+        base = Path(base) if base is not None else self.root
+        results = self.scan_many(base.glob(pattern))
+        self._forget_deleted()
+        self.flush()
+        return results
+
+    def scan_many(self, paths: Iterable[Union[str, Path]]) -> Dict[Path, Dict[str, Any]]:
+        """
+        Metrics for many files, in sorted path order. Unchanged files come from
+        the cache; the rest are read, hashed and parsed in the process pool.
+        """
+        results: Dict[Path, Optional[Dict[str, Any]]] = {}
+        pending: Dict[str, Tuple[Path, str, os.stat_result]] = {}
+        jobs: List[Tuple[str, Optional[str]]] = []
+
+        for path in sorted((p if isinstance(p, Path) else Path(p) for p in paths), key=os.fspath):
+            path_str = os.fspath(path)
+            try:
+                stat = os.stat(path_str)
+            except OSError:
+                self._counters["errors"] += 1
+                continue
+            key = self._key(path_str)
+            entry = self._entries.get(key)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                self._counters["unchanged"] += 1
+                results[path] = entry["metrics"]
+                continue
+            results[path] = None  # filled in below, keeps the sorted order
+            pending[path_str] = (path, key, stat)
+            jobs.append((path_str, entry["sha256"] if entry else None))
+
+        for path_str, sha256, metrics in self._read(jobs):
+            path, key, stat = pending[path_str]
+            if sha256 is None:
+                self._counters["errors"] += 1
+                del results[path]
+                continue
+            if metrics is None:
+                self._counters["rehashed"] += 1
+                metrics = self._entries[key]["metrics"]
+            else:
+                self._counters["parsed"] += 1
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256, "metrics": metrics}
+            with self._lock:
+                self._entries[key] = entry
+                self._dirty[key] = entry
+            results[path] = metrics
+        return results
+
+    def _read(self, jobs: List[Tuple[str, Optional[str]]]) -> Iterable[Tuple[str, Optional[str], Optional[Dict[str, Any]]]]:
+        if self.workers <= 1 or len(jobs) < PARALLEL_MIN_FILES:
+            return _read_chunk(jobs)
+        # ~4 chunks per worker: few round trips, and a slow chunk can't stall the rest for long
+        size = max(32, -(-len(jobs) // (self.workers * 4)))
+        chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return [result for chunk in pool.map(_read_chunk, chunks) for result in chunk]
+
+    def _forget_deleted(self):
+        with self._lock:
+            gone = [key for key in self._entries if not (self.root / key).exists()]
+            for key in gone:
+                del self._entries[key]
+                self._dirty[key] = None
+        self._counters["removed"] += len(gone)
+
+    def flush(self):
+        """Write new and changed entries to the SQLite file"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        if self._db is None or not dirty:
+            return
+        with self._db:
+            self._db.executemany("DELETE FROM source_scan WHERE path = ?",
+                                 [(key,) for key, entry in dirty.items() if entry is None])
+            self._db.executemany(
+                "INSERT OR REPLACE INTO source_scan (path, mtime_ns, size, sha256, version, metrics) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, entry["mtime_ns"], entry["size"], entry["sha256"], METRICS_VERSION, json.dumps(entry["metrics"]))
+                 for key, entry in dirty.items() if entry is not None]
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._counters, "entries": len(self._entries), "persistent": self._db is not None}
+
+
+_caches: Dict[Path, SourceScanCache] = {}
+
+
+def get_scan_cache(root: Union[str, Path] = ".") -> SourceScanCache:
+    root = Path(os.path.abspath(root))
+    if root not in _caches:
+        db_path = os.getenv("ARCO_SCAN_CACHE") or str(root / ".arco-cache" / "source-scan.sqlite")
+        workers = int(os.getenv("ARCO_SCAN_WORKERS", "0")) or None
+        cache = SourceScanCache(root, None if db_path == "off" else db_path, workers=workers)
+        atexit.register(cache.flush)
+        _caches[root] = cache
+    return _caches[root]
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+ARCO - TLS Probe
+Shared by the Intelligence API and the CLI scripts
+
+- One SSLContext for every probe (no per-call create_default_context())
+- TLS session resumption: the last session per host:port is offered on the
+  next handshake, so repeat probes skip the full key exchange
+- Certificate cache keyed by SHA-256 fingerprint: an unchanged certificate
+  reuses its parsed fields and any cached analysis (issuer/expiry/cipher
+  scoring) instead of recomputing them
+
+asyncio's transports can't offer a saved session, so the async variant runs
+the (socket-timeout bounded) handshake on a small worker pool instead.
+
+Usage:
+    from arco_shared.tls_probe import get_tls_probe
+
+    probe = get_tls_probe()
+    handshake = probe.handshake("example.com", timeout=5)               # blocking
+    handshake = await probe.ahandshake("example.com", timeout=5)        # asyncio
+    analysis = probe.analyze(handshake, "expiry", lambda h: {...})      # cached per certificate
+
+Env:
+    ARCO_TLS_WORKERS   threads for async handshakes (default 16)
+"""
+
+import asyncio
+import hashlib
+import os
+import socket
+import ssl
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class TLSHandshake:
+    """What one handshake learned about a host"""
+
+    def __init__(self, host: str, port: int, fingerprint: str, cert: Dict, protocol: Optional[str],
+                 cipher: Optional[Tuple], session_reused: bool, cert_cached: bool):
+        self.host = host
+        self.port = port
+        self.fingerprint = fingerprint
+        self.cert = cert
+        self.protocol = protocol
+        self.cipher = cipher
+        self.session_reused = session_reused
+        self.cert_cached = cert_cached
+
+
+class TLSProbe:
+    def __init__(self, max_entries: int = 4096, max_workers: int = 16):
+        self.context = ssl.create_default_context()
+        self.max_entries = max_entries
+        self._sessions: "OrderedDict[Tuple[str, int], ssl.SSLSession]" = OrderedDict()
+        self._certs: "OrderedDict[str, Dict]" = OrderedDict()
+        self._analyses: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tls-probe")
+        self._counters = {
+            "handshakes": 0,
+            "sessions_reused": 0,
+            "cert_cache_hits": 0,
+            "analysis_cache_hits": 0,
+        }
+
+    def handshake(self, host: str, port: int = 443, timeout: float = 10) -> TLSHandshake:
+        """Blocking handshake, resuming the previous session for host:port when possible"""
+        key = (host.lower(), port)
+        with self._lock:
+            session = self._sessions.get(key)
+
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            try:
+                ssock = self.context.wrap_socket(sock, server_hostname=host, session=session)
+            except ssl.SSLError:
+                if session is None:
+                    raise
+                # Server rejected the saved session outright - fall back to a full handshake
+                with self._lock:
+                    self._sessions.pop(key, None)
+                return self.handshake(host, port, timeout)
+
+            with ssock:
+                der = ssock.getpeercert(binary_form=True) or b""
+                fingerprint = hashlib.sha256(der).hexdigest()
+
+                with self._lock:
+                    cert = self._certs.get(fingerprint)
+                    if cert is not None:
+                        self._certs.move_to_end(fingerprint)
+                cert_cached = cert is not None
+                if cert is None:
+                    cert = ssock.getpeercert()
+
+                result = TLSHandshake(
+                    host=host,
+                    port=port,
+                    fingerprint=fingerprint,
+                    cert=cert,
+                    protocol=ssock.version(),
+                    cipher=ssock.cipher(),
+                    session_reused=ssock.session_reused,
+                    cert_cached=cert_cached,
+                )
+                self._collect_ticket(ssock)
+
+                with self._lock:
+                    self._counters["handshakes"] += 1
+                    self._counters["sessions_reused"] += int(result.session_reused)
+                    self._counters["cert_cache_hits"] += int(cert_cached)
+                    if not cert_cached:
+                        self._put(self._certs, fingerprint, cert)
+                    # A ticket-less session can't be resumed; keep the previous one instead
+                    if ssock.session is not None and (ssock.session.has_ticket or key not in self._sessions):
+                        self._put(self._sessions, key, ssock.session)
+
+                return result
+
+    async def ahandshake(self, host: str, port: int = 443, timeout: float = 10) -> TLSHandshake:
+        """asyncio variant; the handshake is bounded by the socket timeout and by wait_for"""
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(
+            loop.run_in_executor(self._executor, self.handshake, host, port, timeout),
+            timeout=timeout * 2
+        )
+
+    def analyze(self, handshake: TLSHandshake, name: str, analyzer: Callable[[TLSHandshake], Dict]) -> Dict:
+        """
+        analyzer(handshake), cached per (name, certificate, protocol, cipher) -
+        the inputs an issuer/expiry/cipher analysis depends on
+        """
+        cipher_name = handshake.cipher[0] if handshake.cipher else None
+        key = (name, handshake.fingerprint, handshake.protocol, cipher_name)
+        with self._lock:
+            cached = self._analyses.get(key)
+            if cached is not None:
+                self._analyses.move_to_end(key)
+                self._counters["analysis_cache_hits"] += 1
+                return dict(cached)
+
+        analysis = analyzer(handshake)
+        with self._lock:
+            self._put(self._analyses, key, analysis)
+        return dict(analysis)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "sessions": len(self._sessions),
+                "certificates": len(self._certs),
+                "analyses": len(self._analyses),
+            }
+
+    @staticmethod
+    def _collect_ticket(ssock: ssl.SSLSocket):
+        """TLS 1.3 tickets arrive after the handshake; pick up any already received"""
+        if ssock.version() != "TLSv1.3":
+            return
+        # Non-blocking read: processes a pending ticket without waiting for one
+        try:
+            ssock.setblocking(False)
+            ssock.recv(1)
+        except (ssl.SSLWantReadError, ssl.SSLError, OSError):
+            pass
+
+    def _put(self, table: OrderedDict, key, value):
+        """LRU insert; caller holds the lock"""
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > self.max_entries:
+            table.popitem(last=False)
+
+
+_default_probe: Optional[TLSProbe] = None
+_default_lock = threading.Lock()
+
+
+def get_tls_probe() -> TLSProbe:
+    """Process-wide probe (shared context, sessions and certificate cache)"""
+    global _default_probe
+    with _default_lock:
+        if _default_probe is None:
+            _default_probe = TLSProbe(max_workers=int(os.getenv("ARCO_TLS_WORKERS", "16")))
+        return _default_probe
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+ARCO - WHOIS Record Store
+Shared by the Intelligence API and the CLI scripts
+
+Registration data changes rarely and registrars rate-limit aggressively, so:
+- Records are kept per domain (in memory, plus an optional SQLite file)
+- Cached records are returned instantly; a record older than max_age, or whose
+  expiration_date is within expiry_margin, is refreshed in the background
+- Concurrent requests for the same domain share one lookup (single-flight)
+- Failed lookups (unregistered domain, unsupported TLD, rate limit) are
+  remembered for error_ttl and re-raised without asking the registrar again
+- At most max_concurrent lookups hit registrars at once
+
+Usage:
+    from arco_shared.whois_store import get_whois_store
+
+    record = get_whois_store().get("example.com", timeout=15)          # blocking
+    record = await get_whois_store().aget("example.com", timeout=15)   # asyncio
+
+Env:
+    ARCO_WHOIS_DB              SQLite file (unset = memory only)
+    ARCO_WHOIS_MAX_AGE         seconds before a record is refreshed (default 7 days)
+    ARCO_WHOIS_EXPIRY_MARGIN   refresh when expiration_date is this close (default 14 days)
+    ARCO_WHOIS_WORKERS         concurrent registrar lookups (default 4)
+    ARCO_WHOIS_ERROR_TTL       seconds a failed lookup is remembered (default 15 min)
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import whois
+
+
+def _first(value):
+    """python-whois returns a list when registries disagree; keep the first"""
+    if isinstance(value, (list, tuple)):
+        return value[0] if value else None
+    return value
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+class WhoisStore:
+    def __init__(self, db_path: Optional[str] = None, max_age: float = 7 * 86400,
+                 expiry_margin: float = 14 * 86400, max_concurrent: int = 4, max_entries: int = 10000,
+                 error_ttl: float = 900.0):
+        self.max_age = max_age
+        self.expiry_margin = expiry_margin
+        self.max_entries = max_entries
+        self.error_ttl = error_ttl
+        self._records: "OrderedDict[str, Dict]" = OrderedDict()
+        # Negative entries: domain -> (exception, monotonic expiry), memory only
+        self._failures: "OrderedDict[str, Tuple[Exception, float]]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._registrar_slots = threading.Semaphore(max_concurrent)
+        self._db: Optional[sqlite3.Connection] = None
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "lookups": 0,
+            "coalesced": 0,
+            "failures": 0,
+            "negative_hits": 0,
+        }
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=5)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS whois_records ("
+                "domain TEXT PRIMARY KEY, record TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, domain: str, timeout: Optional[float] = None) -> Dict:
+        """Cached record (refreshing in the background when stale), else a blocking lookup"""
+        domain = self._key(domain)
+        record = self._cached(domain)
+        if record is not None:
+            return record
+        return self._lookup(domain).result(timeout=timeout)
+
+    async def aget(self, domain: str, timeout: Optional[float] = None) -> Dict:
+        """asyncio variant - the lookup thread is shared, awaiting it blocks nothing"""
+        domain = self._key(domain)
+        record = await asyncio.to_thread(self._cached, domain) if self._db is not None else self._cached(domain)
+        if record is not None:
+            return record
+        # shield: one caller timing out must not cancel the lookup other callers share
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self._lookup(domain))), timeout=timeout)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self._counters,
+                "records": len(self._records),
+                "negative_entries": len(self._failures),
+                "in_flight": len(self._in_flight),
+                "persistent": self._db is not None,
+            }
+
+    @staticmethod
+    def _key(domain: str) -> str:
+        return domain.strip().lower().rstrip(".")
+
+    def needs_refresh(self, record: Dict, now: Optional[float] = None) -> bool:
+        """Too old, or the registration is about to expire (renewal will change it)"""
+        now = now if now is not None else time.time()
+        if now - record["fetched_at"] > self.max_age:
+            return True
+        expiration = _parse_date(record.get("expiration_date"))
+        if expiration is not None and (expiration - datetime.utcnow()).total_seconds() < self.expiry_margin:
+            # Renewal is due soon - re-check at most daily until it shows up
+            return now - record["fetched_at"] > min(self.max_age, 86400)
+        return False
+
+    def _cached(self, domain: str) -> Optional[Dict]:
+        with self._lock:
+            record = self._records.get(domain)
+            if record is not None:
+                self._records.move_to_end(domain)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT record FROM whois_records WHERE domain = ?", (domain,)
+                ).fetchone()
+                if row is not None:
+                    record = json.loads(row[0])
+                    self._remember(domain, record)
+
+            if record is None:
+                self._counters["misses"] += 1
+                return None
+
+            if self.needs_refresh(record):
+                self._counters["stale_hits"] += 1
+                stale = True
+            else:
+                self._counters["hits"] += 1
+                stale = False
+
+        if stale:
+            self._lookup(domain)
+        return dict(record)
+
+    def _lookup(self, domain: str) -> Future:
+        """Start a lookup, join the one already running, or replay a recent failure"""
+        with self._lock:
+            failure = self._failures.get(domain)
+            if failure is not None:
+                if failure[1] > time.monotonic():
+                    self._counters["negative_hits"] += 1
+                    future = Future()
+                    future.set_exception(failure[0])
+                    return future
+                del self._failures[domain]
+            future = self._in_flight.get(domain)
+            if future is not None:
+                self._counters["coalesced"] += 1
+                return future
+            future = Future()
+            self._in_flight[domain] = future
+            self._counters["lookups"] += 1
+
+        def run():
+            future.set_running_or_notify_cancel()
+            try:
+                with self._registrar_slots:
+                    record = self._fetch(domain)
+                self._store(domain, record)
+                future.set_result(dict(record))
+            except BaseException as e:
+                with self._lock:
+                    self._counters["failures"] += 1
+                    if isinstance(e, Exception) and self.error_ttl > 0:
+                        self._failures[domain] = (e, time.monotonic() + self.error_ttl)
+                        self._failures.move_to_end(domain)
+                        while len(self._failures) > self.max_entries:
+                            self._failures.popitem(last=False)
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._in_flight.pop(domain, None)
+
+        # Daemon thread: a hung registrar can't keep a CLI run from exiting
+        threading.Thread(target=run, name=f"whois-{domain}", daemon=True).start()
+        return future
+
+    @staticmethod
+    def _fetch(domain: str) -> Dict[str, Any]:
+        w = whois.whois(domain)
+        creation = _first(getattr(w, "creation_date", None))
+        expiration = _first(getattr(w, "expiration_date", None))
+        return {
+            "registrar": getattr(w, "registrar", None),
+            "creation_date": str(creation) if creation else None,
+            "expiration_date": str(expiration) if expiration else None,
+            "name_servers": _as_list(getattr(w, "name_servers", None)),
+            "status": getattr(w, "status", None),
+            "fetched_at": time.time(),
+        }
+
+    def _store(self, domain: str, record: Dict):
+        with self._lock:
+            self._remember(domain, record)
+            self._failures.pop(domain, None)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO whois_records (domain, record, fetched_at) VALUES (?, ?, ?)",
+                    (domain, json.dumps(record, default=str), record["fetched_at"])
+                )
+                self._db.commit()
+
+    def _remember(self, domain: str, record: Dict):
+        """Memory LRU insert; caller holds the lock"""
+        self._records[domain] = record
+        self._records.move_to_end(domain)
+        while len(self._records) > self.max_entries:
+            self._records.popitem(last=False)
+
+
+_default_store: Optional[WhoisStore] = None
+_default_lock = threading.Lock()
+
+
+def get_whois_store() -> WhoisStore:
+    """Process-wide store configured from the environment"""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = WhoisStore(
+                db_path=os.getenv("ARCO_WHOIS_DB") or None,
+                max_age=float(os.getenv("ARCO_WHOIS_MAX_AGE", str(7 * 86400))),
+                expiry_margin=float(os.getenv("ARCO_WHOIS_EXPIRY_MARGIN", str(14 * 86400))),
+                max_concurrent=int(os.getenv("ARCO_WHOIS_WORKERS", "4")),
+                error_ttl=float(os.getenv("ARCO_WHOIS_ERROR_TTL", "900")),
+            )
+        return _default_store
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+ARCO - HTML parsing benchmark
+
+Compares the old content-analysis path (BeautifulSoup tree + seven find_all()
+passes + get_text()) with the single-pass html_digest backends.
+
+Usage:
+    python .local-python-scripts/bench_html_parsing.py                     # synthetic ~2 MB page
+    python .local-python-scripts/bench_html_parsing.py page.html https://example.com
+    python .local-python-scripts/bench_html_parsing.py --repeat 20 saved/*.html
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import urllib.request
+from typing import Callable, Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+
+from arco_shared.html_digest import BACKENDS, digest_html
+
+
+def synthetic_page(sections: int = 2000) -> str:
+    """Shaped like a large marketing/news page: heavy head, scripts, nav, many text blocks"""
+    head = ['<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">',
+            '<title>Large synthetic page</title>',
+            '<meta name="description" content="Synthetic benchmark page">']
+    head += [f'<link rel="preload" href="/_next/static/chunk-{i}.js" as="script">' for i in range(40)]
+    head += ['<style>' + 'body{margin:0}.c{color:#333}' * 200 + '</style>', '</head><body>']
+    nav = '<nav>' + ''.join(f'<a href="/section/{i}">Section {i}</a>' for i in range(60)) + '</nav>'
+    blocks = []
+    for i in range(sections):
+        blocks.append(
+            f'<section><h2>Heading {i}</h2><h3>Sub {i}</h3>'
+            f'<p>Paragraph {i} with <a href="/a/{i}">a link</a> and <strong>emphasis</strong>. '
+            + 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 8 +
+            f'</p><img src="/img/{i}.webp" alt="image {i}"><ul>'
+            + ''.join(f'<li><a href="/item/{i}/{j}">Item {j}</a></li>' for j in range(5)) +
+            f'</ul><script>window.__data_{i} = {{"id": {i}, "items": [1, 2, 3]}};</script></section>'
+        )
+    return ''.join(head) + nav + '<main><h1>Benchmark</h1>' + ''.join(blocks) + '</main></body></html>'
+
+
+def load(source: str) -> str:
+    if source.startswith(('http://', 'https://')):
+        request = urllib.request.Request(source, headers={"User-Agent": "ARCO-Benchmark/1.0"})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.read().decode(response.headers.get_content_charset() or 'utf-8', errors='replace')
+    with open(source, encoding='utf-8', errors='replace') as handle:
+        return handle.read()
+
+
+def soup_analysis(parser: str) -> Callable[[str], Dict]:
+    """What _analyze_content_structure used to do"""
+    def run(html: str) -> Dict:
+        soup = BeautifulSoup(html, parser)
+        headings = {f'h{i}': len(soup.find_all(f'h{i}')) for i in range(1, 7)}
+        return {
+            "headings": headings,
+            "p": len(soup.find_all('p')),
+            "img": len(soup.find_all('img')),
+            "a": len(soup.find_all('a')),
+            "words": len(soup.get_text().split()),
+        }
+    return run
+
+
+def digest_analysis(backend: str) -> Callable[[str], Dict]:
+    def run(html: str) -> Dict:
+        digest = digest_html(html, backend)
+        return {
+            "headings": digest.headings(),
+            "p": digest.count('p'),
+            "img": digest.count('img'),
+            "a": digest.count('a'),
+            "words": len(digest.text.split()),
+        }
+    return run
+
+
+def measure(fn: Callable[[str], Dict], html: str, repeat: int) -> Tuple[float, Dict]:
+    result = fn(html)  # warm-up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('sources', nargs='*', help='HTML files or URLs (default: synthetic page)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    pages = [(source, load(source)) for source in args.sources] or [("synthetic", synthetic_page())]
+
+    candidates = {"bs4 html.parser (old)": soup_analysis('html.parser')}
+    try:
+        import lxml  # noqa: F401
+        candidates["bs4 lxml"] = soup_analysis('lxml')
+    except ImportError:
+        pass
+    for backend in BACKENDS:
+        candidates[f"digest {backend}"] = digest_analysis(backend)
+
+    for name, html in pages:
+        print(f"\n{name}: {len(html.encode('utf-8')) / 1024:.0f} KiB")
+        baseline = None
+        for label, fn in candidates.items():
+            seconds, result = measure(fn, html, args.repeat)
+            baseline = baseline or seconds
+            print(f"  {label:<24} {seconds * 1000:9.1f} ms  {baseline / seconds:5.1f}x  "
+                  f"h2={result['headings']['h2']} p={result['p']} a={result['a']} words={result['words']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
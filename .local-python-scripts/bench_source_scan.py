@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+ARCO - Source scan benchmark
+
+Builds a synthetic src/ tree of TSX components and times:
+- the old per-file loop (read + regex cascade, one core)
+- a cold source_scan with 1 worker and with N workers
+- a warm scan (nothing changed) and a scan after editing 1% of the files
+and checks that every worker count yields identical metrics.
+
+Usage:
+    python .local-python-scripts/bench_source_scan.py                    # 50k files in a temp dir
+    python .local-python-scripts/bench_source_scan.py --files 5000 --workers 1 2 4 8
+    python .local-python-scripts/bench_source_scan.py --tree /path/to/project   # real project
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from arco_shared.source_scan import SourceScanCache
+
+
+def synthetic_component(index: int, rnd: random.Random) -> str:
+    hooks = "\n".join(f"  const [v{j}, setV{j}] = useState({j});" for j in range(rnd.randint(0, 6)))
+    effects = "\n".join(f"  useEffect(() => {{ if (v0 && v{j}) setV0(v0 + {j}); }}, [v0]);"
+                        for j in range(rnd.randint(0, 3)))
+    items = "\n".join(f'        <li className="item-{j}" aria-label="item {j}"><Badge>{j}</Badge></li>'
+                      for j in range(rnd.randint(2, 30)))
+    return f"""import React, {{ useState, useEffect, useMemo }} from 'react';
+import {{ motion }} from 'framer-motion';
+import {{ Badge }} from '../ui/Badge';
+import {{ Card }} from './Card{index % 50}';
+import {{ cn }} from '@/lib/utils';
+
+// Component {index}
+interface Component{index}Props {{
+  title: string;
+  items?: string[];
+}}
+
+export function Component{index}({{ title, items = [] }}: Component{index}Props) {{
+{hooks}
+{effects}
+  const sorted = useMemo(() => [...items].sort(), [items]);
+  return (
+    <motion.section className={{cn('component', title && 'titled')}} style={{{{ padding: {index % 16} }}}}>
+      <Card title={{title}}>
+        <ul>
+{items}
+        </ul>
+      </Card>
+    </motion.section>
+  );
+}}
+"""
+
+
+def build_tree(root: Path, files: int, seed: int = 7) -> List[Path]:
+    rnd = random.Random(seed)
+    paths = []
+    for index in range(files):
+        folder = root / "src" / "components" / f"group{index % 200}" / f"sub{index % 7}"
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"Component{index}.tsx"
+        path.write_text(synthetic_component(index, rnd), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def old_loop(root: Path) -> Dict[str, Tuple]:
+    """What analyze_component_dependencies + _analyze_existing_components used to do per file"""
+    results = {}
+    for file_path in root.glob("src/**/*.tsx"):
+        content = file_path.read_text(encoding="utf-8")
+        lines = content.split("\n")
+        results[str(file_path)] = (
+            len([line for line in lines if line.strip() and not line.strip().startswith("//")]),
+            re.findall(r'import.*from [\'"]([^\'\"]+)[\'"]', content),
+            len(re.findall(r"use[A-Z]\w+", content)),
+            len(re.findall(r"interface \w+Props", content)),
+            len(re.findall(r"useState|useReducer", content)),
+            len(re.findall(r"<\w+", content)),
+        )
+    return results
+
+
+def timed(fn: Callable[[], object]) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50000)
+    parser.add_argument("--workers", type=int, nargs="*", default=sorted({1, os.cpu_count() or 1}))
+    parser.add_argument("--tree", help="existing project root to scan instead of a synthetic tree")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="arco-scan-bench-") as scratch:
+        if args.tree:
+            root = Path(args.tree)
+            paths = sorted(root.glob("src/**/*.tsx"))
+        else:
+            seconds, paths = timed(lambda: build_tree(Path(scratch), args.files))
+            root = Path(scratch)
+            print(f"built {len(paths)} files in {seconds:.1f}s")
+        print(f"{len(paths)} files, {sum(p.stat().st_size for p in paths) / 1024 / 1024:.1f} MiB, "
+              f"{os.cpu_count()} CPUs\n")
+
+        seconds, _ = timed(lambda: old_loop(root))
+        baseline = seconds
+        print(f"  {'old loop (1 core)':<28} {seconds:8.2f} s")
+
+        reference = None
+        for workers in args.workers:
+            cache = SourceScanCache(root, workers=workers)
+            seconds, results = timed(lambda: cache.scan_many(paths))
+            print(f"  {f'cold scan, {workers} worker(s)':<28} {seconds:8.2f} s  {baseline / seconds:5.1f}x")
+            # Same metrics, in the same order, whatever the worker count
+            serialized = json.dumps([(str(path), metrics) for path, metrics in results.items()])
+            if reference is None:
+                reference = serialized
+            elif serialized != reference:
+                print(f"  !! results with {workers} workers differ from {args.workers[0]} worker(s)")
+                return 1
+
+        seconds, _ = timed(lambda: cache.scan_many(paths))
+        print(f"  {'warm scan (no changes)':<28} {seconds:8.2f} s  {baseline / seconds:5.1f}x")
+
+        if not args.tree:
+            for path in random.Random(1).sample(paths, max(1, len(paths) // 100)):
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write("// edited\n")
+            seconds, _ = timed(lambda: cache.scan_many(paths))
+            print(f"  {'1% of files edited':<28} {seconds:8.2f} s  {baseline / seconds:5.1f}x")
+
+        print(f"\n  {cache.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
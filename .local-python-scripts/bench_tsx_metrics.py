@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+ARCO - TSX metrics micro-benchmark
+
+Compares, on the same files and checking all give the same metrics:
+- the regex cascade the analyzers used to run per file (five findall() calls
+  plus five list comprehensions over the lines)
+- source_scan.extract_metrics
+- a fused single-pass tokenizer (one alternation regex, counted on the
+  findall() columns). Kept as a reference: sre tries every branch at every
+  character, so on CPython it loses to a few literal-prefix scans.
+
+Usage:
+    python .local-python-scripts/bench_tsx_metrics.py                  # ./src/**/*.tsx
+    python .local-python-scripts/bench_tsx_metrics.py --repeat 10 path/to/project
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from itertools import accumulate, compress
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from arco_shared.source_scan import _decode, extract_metrics
+
+_IMPORT = re.compile(r'import.*from [\'"]([^\'\"]+)[\'"]')
+_HOOK = re.compile(r'use[A-Z]\w+')
+_STATE_HOOK = re.compile(r'useState|useReducer')
+_PROPS = re.compile(r'interface \w+Props')
+_JSX_ELEMENT = re.compile(r'<\w+')
+
+
+def cascade_metrics(content: str) -> Dict[str, Any]:
+    """The per-file work of analyzer / s_tier_consolidation / real_implementation_tracker"""
+    lines = content.split('\n')
+    return {
+        "total_lines": len(lines),
+        "code_lines": len([line for line in lines if line.strip() and not line.strip().startswith('//')]),
+        "imports": _IMPORT.findall(content),
+        "hooks": len(_HOOK.findall(content)),
+        "state_hooks": len(_STATE_HOOK.findall(content)),
+        "props": len(_PROPS.findall(content)),
+        "jsx_elements": len(_JSX_ELEMENT.findall(content)),
+        "function_lines": len([line for line in lines if 'function' in line or '=>' in line]),
+        "condition_lines": len([line for line in lines if '&&' in line or '||' in line]),
+        "inline_style_lines": len([line for line in lines if 'style={{' in line]),
+        "complex_jsx_lines": len([line for line in lines if line.count('<') > 2]),
+    }
+
+
+_TOKENS = re.compile(r"""
+      \n[^\S\n]*(?:(//)|(?=(\S)))?                # line start: 0 comment, 1 first non-blank
+    | u(se[A-Z]\w+)                             # 2 hook
+    | i(nterface\ )(?=\w+Props)                 # 3
+    | i(mport)                                  # 4
+    | from\ ['"](?=([^'"\n]+)['"])              # 5 specifier
+    | f(unction) | =(>)                         # 6, 7
+    | &(&) | \|(\|)                              # 8, 9
+    | s(tyle=\{\{)                               # 10
+    | <(?=(\w)) | <(?<=(<))                     # 11 JSX element, 12 other '<'
+""", re.VERBOSE)
+
+
+def fused_metrics(content: str) -> Dict[str, Any]:
+    """One findall() over the source; every branch starts with a literal so sre can skip ahead"""
+    rows = _TOKENS.findall('\n' + content)
+    (comment, first, hook, props, import_, spec,
+     function, arrow, and_, or_, style, tag, less_than) = zip(*rows)
+
+    def hits(column) -> int:
+        return len(column) - column.count("")
+
+    # Id of the (non-blank) line of every token
+    line_of = list(accumulate(map(bool, map(max, comment, first))))
+
+    def lines_with(*columns) -> int:
+        return len(set().union(*(compress(line_of, column) for column in columns)))
+
+    lt_per_line = Counter(compress(line_of, tag))
+    lt_per_line.update(compress(line_of, less_than))
+
+    imports: Dict[int, str] = {}
+    first_import: Dict[int, int] = {}
+    for index in compress(range(len(rows)), map(max, import_, spec)):
+        line = line_of[index]
+        if import_[index]:
+            first_import.setdefault(line, index)
+        elif line in first_import:
+            imports[line] = spec[index]
+
+    hooks = list(filter(None, hook))
+    return {
+        "total_lines": content.count('\n') + 1,
+        "code_lines": hits(first),
+        "imports": list(imports.values()),
+        "hooks": len(hooks),
+        "state_hooks": sum(1 for name in hooks if name.startswith(("seState", "seReducer"))),
+        "props": hits(props),
+        "jsx_elements": hits(tag),
+        "function_lines": lines_with(function, arrow),
+        "condition_lines": lines_with(and_, or_),
+        "inline_style_lines": lines_with(style),
+        "complex_jsx_lines": sum(1 for count in lt_per_line.values() if count > 2),
+    }
+
+
+def measure(fn: Callable[[str], Dict], sources: List[str], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for source in sources:
+            fn(source)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('root', nargs='?', default='.')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    files = sorted(Path(args.root).glob('src/**/*.tsx'))
+    sources = [_decode(path.read_bytes()) for path in files]
+    print(f"{len(sources)} files, {sum(map(len, sources)) / 1024:.0f} KiB")
+
+    candidates = {
+        "regex cascade (old)": cascade_metrics,
+        "extract_metrics": extract_metrics,
+        "fused tokenizer": fused_metrics,
+    }
+
+    mismatches = 0
+    for path, source in zip(files, sources):
+        expected = cascade_metrics(source)
+        for label, fn in candidates.items():
+            actual = fn(source)
+            diff = {key: (value, actual[key]) for key, value in expected.items() if actual[key] != value}
+            if diff:
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"  {label} mismatch {path}: {diff}")
+
+    baseline = None
+    for label, fn in candidates.items():
+        seconds = measure(fn, sources, args.repeat)
+        baseline = baseline or seconds
+        print(f"  {label:<20} {seconds * 1000:8.1f} ms  {baseline / seconds:5.2f}x")
+    print(f"  mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -14,17 +14,57 @@ Validates domain and returns comprehensive analysis:
 Usage:
     python scripts/domain_validator.py <domain>
     python scripts/domain_validator.py example.com
+
+Worker mode (long-lived, used by /api/domain/validate):
+    python scripts/domain_validator.py --serve [--workers N]
+
+    Reads one JSON request per stdin line: {"id": "1", "domain": "example.com"}
+    Writes one JSON response per stdout line: {"id": "1", "result": {...}}
+    Requests run concurrently, so responses may come back out of order.
 """
 
 import sys
 import json
 import dns.resolver
-import whois
 import requests
-import ssl
-import socket
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from arco_shared.dns_cache import get_resolver
+from arco_shared.whois_store import get_whois_store
+from arco_shared.tls_probe import get_tls_probe
+
+# Network probes run concurrently; the whole validation is bounded by one deadline
+VALIDATION_DEADLINE = float(os.getenv("DOMAIN_VALIDATOR_DEADLINE", "20"))
+DNS_LIFETIME = float(os.getenv("DOMAIN_VALIDATOR_DNS_TIMEOUT", "5"))
+SSL_TIMEOUT = 5
+
+
+def _certificate_expiry(handshake) -> Dict:
+    not_after = datetime.strptime(handshake.cert['notAfter'], '%b %d %H:%M:%S %Y %Z')
+    return {"notAfter": not_after.isoformat()}
+
+
+def _run_probe(fn, *args) -> Future:
+    """
+    Run fn on its own daemon thread. Unlike a ThreadPoolExecutor, a probe stuck
+    past the deadline (e.g. a hung WHOIS server) can't keep the process from exiting.
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name=f"probe-{fn.__name__}", daemon=True).start()
+    return future
 
 class DomainValidator:
     def __init__(self, domain: str):
@@ -48,14 +88,8 @@ class DomainValidator:
             if not self._validate_format():
                 return self.results
             
-            # 2. Check DNS records
-            self._check_dns()
-            
-            # 3. Get WHOIS data
-            self._get_whois()
-            
-            # 4. Check SSL certificate
-            self._check_ssl()
+            # 2-4. DNS records, WHOIS data and SSL certificate, in parallel
+            self._run_network_probes()
             
             # 5. Check availability in database (mock for now)
             self._check_database_availability()
@@ -83,74 +117,97 @@ class DomainValidator:
         
         return is_valid
     
-    def _check_dns(self):
+    def _run_network_probes(self):
+        """
+        Run DNS (A/MX/TXT), WHOIS and SSL probes concurrently under VALIDATION_DEADLINE.
+        Probes return their updates instead of writing self.results, so one that
+        overruns the deadline can't touch the results after they are returned.
+        """
+        # Each DNS record type is its own probe too
+        dns_futures = {
+            rdtype: _run_probe(self._resolve_records, rdtype)
+            for rdtype in ("A", "MX", "TXT")
+        }
+        futures = {
+            "WHOIS lookup": _run_probe(self._get_whois),
+            "SSL check": _run_probe(self._check_ssl),
+        }
+        
+        done, _ = wait([*dns_futures.values(), *futures.values()], timeout=VALIDATION_DEADLINE)
+        
+        # DNS: a record type that timed out or failed simply has no records
+        records = {
+            rdtype: future.result() if future in done and future.exception() is None else []
+            for rdtype, future in dns_futures.items()
+        }
+        updates, errors = self._check_dns(records)
+        self.results.update(updates)
+        self.results["errors"].extend(errors)
+        
+        for label, future in futures.items():
+            if future not in done:
+                self.results["errors"].append(f"{label} timed out after {VALIDATION_DEADLINE:g}s")
+                continue
+            updates, errors = future.result()
+            self.results.update(updates)
+            self.results["errors"].extend(errors)
+    
+    def _resolve_records(self, rdtype: str) -> List[str]:
+        """Resolve one record type (TTL-cached); failures mean no records"""
+        try:
+            answers = get_resolver().resolve(self.domain, rdtype, lifetime=DNS_LIFETIME)
+        except Exception:
+            return []
+        if rdtype == "MX":
+            return [str(rdata.exchange) for rdata in answers]
+        return [str(rdata) for rdata in answers]
+    
+    def _check_dns(self, records: Dict[str, List[str]]) -> Tuple[Dict, List[str]]:
         """Check DNS records (A, MX, TXT)"""
         try:
-            # A records
-            a_records = []
-            try:
-                answers = dns.resolver.resolve(self.domain, 'A')
-                a_records = [str(rdata) for rdata in answers]
-            except:
-                pass
-            
-            # MX records
-            mx_records = []
-            try:
-                answers = dns.resolver.resolve(self.domain, 'MX')
-                mx_records = [str(rdata.exchange) for rdata in answers]
-            except:
-                pass
-            
-            # TXT records
-            txt_records = []
-            try:
-                answers = dns.resolver.resolve(self.domain, 'TXT')
-                txt_records = [str(rdata) for rdata in answers]
-            except:
-                pass
-            
-            self.results["dnsRecords"] = {
-                "a": a_records,
-                "mx": mx_records,
-                "txt": txt_records,
-                "hasRecords": len(a_records) > 0,
-            }
+            return {
+                "dnsRecords": {
+                    "a": records["A"],
+                    "mx": records["MX"],
+                    "txt": records["TXT"],
+                    "hasRecords": len(records["A"]) > 0,
+                }
+            }, []
         except Exception as e:
-            self.results["errors"].append(f"DNS check failed: {str(e)}")
+            return {}, [f"DNS check failed: {str(e)}"]
     
-    def _get_whois(self):
-        """Get WHOIS data"""
+    def _get_whois(self) -> Tuple[Dict, List[str]]:
+        """Get WHOIS data (shared record store, single-flight per domain)"""
         try:
-            w = whois.whois(self.domain)
+            record = get_whois_store().get(self.domain)
             
-            self.results["whoisData"] = {
-                "registrar": w.registrar if hasattr(w, 'registrar') else None,
-                "creationDate": str(w.creation_date[0]) if isinstance(w.creation_date, list) else str(w.creation_date) if w.creation_date else None,
-                "expirationDate": str(w.expiration_date[0]) if isinstance(w.expiration_date, list) else str(w.expiration_date) if w.expiration_date else None,
-                "nameServers": w.name_servers if hasattr(w, 'name_servers') else [],
-                "status": w.status if hasattr(w, 'status') else None,
-            }
+            return {
+                "whoisData": {
+                    "registrar": record["registrar"],
+                    "creationDate": record["creation_date"],
+                    "expirationDate": record["expiration_date"],
+                    "nameServers": record["name_servers"],
+                    "status": record["status"],
+                }
+            }, []
         except Exception as e:
-            self.results["errors"].append(f"WHOIS lookup failed: {str(e)}")
+            return {}, [f"WHOIS lookup failed: {str(e)}"]
     
-    def _check_ssl(self):
+    def _check_ssl(self) -> Tuple[Dict, List[str]]:
         """Check SSL certificate validity"""
         try:
-            context = ssl.create_default_context()
-            with socket.create_connection((self.domain, 443), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=self.domain) as ssock:
-                    cert = ssock.getpeercert()
-                    
-                    # Check if certificate is valid
-                    not_after = datetime.strptime(cert['notAfter'], '%b %d %H:%M:%S %Y %Z')
-                    is_valid = not_after > datetime.now()
-                    
-                    self.results["sslValid"] = is_valid
-                    self.results["sslExpiry"] = not_after.isoformat()
+            probe = get_tls_probe()
+            handshake = probe.handshake(self.domain, 443, timeout=SSL_TIMEOUT)
+            # notAfter is only parsed once per certificate
+            expiry = probe.analyze(handshake, "expiry", _certificate_expiry)
+            not_after = datetime.fromisoformat(expiry["notAfter"])
+            
+            return {
+                "sslValid": not_after > datetime.now(),
+                "sslExpiry": not_after.isoformat(),
+            }, []
         except Exception as e:
-            self.results["sslValid"] = False
-            self.results["errors"].append(f"SSL check failed: {str(e)}")
+            return {"sslValid": False}, [f"SSL check failed: {str(e)}"]
     
     def _check_database_availability(self):
         """Check if domain already exists in database"""
@@ -179,13 +236,59 @@ class DomainValidator:
         self.results["suggestions"] = suggestions[:3]
 
 
+def serve(workers: int = 8):
+    """JSON-lines worker loop: imports are paid once, validations run on a thread pool"""
+    write_lock = threading.Lock()
+    
+    def respond(payload: Dict):
+        line = json.dumps(payload)
+        with write_lock:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+    
+    def handle(request_id, domain: str):
+        try:
+            respond({"id": request_id, "result": DomainValidator(domain).validate()})
+        except Exception as e:
+            respond({"id": request_id, "error": str(e)})
+    
+    # Tell the parent we're warm
+    respond({"id": None, "ready": True})
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validator") as executor:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                respond({"id": None, "error": "Invalid JSON input"})
+                continue
+            
+            request_id = request.get("id")
+            if request.get("ping"):
+                respond({"id": request_id, "pong": True})
+            elif not isinstance(request.get("domain"), str):
+                respond({"id": request_id, "error": "Missing domain"})
+            else:
+                executor.submit(handle, request_id, request["domain"])
+
+
 def main():
     if len(sys.argv) < 2:
         print(json.dumps({
-            "error": "Usage: python domain_validator.py <domain>"
+            "error": "Usage: python domain_validator.py <domain> | --serve [--workers N]"
         }))
         sys.exit(1)
     
+    if sys.argv[1] == "--serve":
+        workers = 8
+        if "--workers" in sys.argv:
+            workers = int(sys.argv[sys.argv.index("--workers") + 1])
+        serve(workers)
+        return
+    
     domain = sys.argv[1]
     validator = DomainValidator(domain)
     results = validator.validate()
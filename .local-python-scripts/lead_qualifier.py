@@ -12,21 +12,107 @@ Qualifies lead based on provided data:
 
 Usage:
     python scripts/lead_qualifier.py '{"email": "...", "domain": "...", "name": "...", "phone": "..."}'
+
+Bulk mode (streams rows in and results out, one MX lookup per email domain):
+    python scripts/lead_qualifier.py --bulk [--format csv|ndjson] [--input leads.csv] [--output out.ndjson]
+                                     [--output-format csv|ndjson] [--concurrency 16]
 """
 
 import sys
 import json
 import re
+import csv
+import time
+import argparse
+import threading
 import dns.resolver
-from typing import Dict
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, Optional, Tuple
 from datetime import datetime
 
+from arco_shared.dns_cache import get_resolver
+
+
+def _lookup_mx(email_domain: str) -> Tuple[bool, float]:
+    """Resolve MX records through the shared TTL cache -> (has_mx, ttl seconds left)"""
+    try:
+        answers = get_resolver().resolve(email_domain, 'MX')
+        return len(answers) > 0, answers.ttl
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        return False, MXCache.NEGATIVE_TTL
+    except Exception:
+        # Timeouts / SERVFAIL: don't trust the answer for long
+        return False, MXCache.ERROR_TTL
+
+
+class MXCache:
+    """
+    Per-domain MX answers with record TTLs, bounded LRU size and in-flight
+    dedup: concurrent requests for one domain share a single lookup.
+    """
+    
+    NEGATIVE_TTL = 300.0
+    ERROR_TTL = 60.0
+    
+    def __init__(self, executor: ThreadPoolExecutor, max_entries: int = 50000,
+                 lookup: Callable[[str], Tuple[bool, float]] = _lookup_mx):
+        self.executor = executor
+        self.max_entries = max_entries
+        self.lookup = lookup
+        self._entries: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "lookups": 0}
+    
+    def prefetch(self, email_domain: str) -> Optional[Future]:
+        """Start a lookup unless the answer is cached or already on its way"""
+        with self._lock:
+            entry = self._entries.get(email_domain)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(email_domain)
+                return None
+            future = self._in_flight.get(email_domain)
+            if future is None:
+                self.stats["lookups"] += 1
+                future = self.executor.submit(self._resolve, email_domain)
+                self._in_flight[email_domain] = future
+            return future
+    
+    def has_mx(self, email_domain: str) -> bool:
+        """Cached answer, waiting for the in-flight lookup if needed"""
+        with self._lock:
+            entry = self._entries.get(email_domain)
+            if entry is not None and entry[1] > time.monotonic():
+                self.stats["hits"] += 1
+                return entry[0]
+        future = self.prefetch(email_domain)
+        if future is None:
+            return self.has_mx(email_domain)
+        return future.result()
+    
+    def _resolve(self, email_domain: str) -> bool:
+        try:
+            has_mx, ttl = self.lookup(email_domain)
+        except Exception:
+            has_mx, ttl = False, self.ERROR_TTL
+        with self._lock:
+            self._entries[email_domain] = (has_mx, time.monotonic() + ttl)
+            self._entries.move_to_end(email_domain)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._in_flight.pop(email_domain, None)
+        return has_mx
+
+
 class LeadQualifier:
-    def __init__(self, data: Dict):
-        self.email = data.get('email', '').lower().strip()
-        self.domain = data.get('domain', '').lower().strip()
-        self.name = data.get('name', '').strip()
-        self.phone = data.get('phone', '')
+    def __init__(self, data: Dict, mx_lookup: Optional[Callable[[str], bool]] = None):
+        # Short CSV rows give None, NDJSON may give null or numbers
+        self.email = str(data.get('email') or '').lower().strip()
+        self.domain = str(data.get('domain') or '').lower().strip()
+        self.name = str(data.get('name') or '').strip()
+        self.phone = str(data.get('phone') or '')
+        self.mx_lookup = mx_lookup or (lambda email_domain: _lookup_mx(email_domain)[0])
         
         self.results = {
             "timestamp": datetime.now().isoformat(),
@@ -95,8 +181,7 @@ class LeadQualifier:
         
         # Check MX records
         try:
-            mx_records = dns.resolver.resolve(email_domain, 'MX')
-            quality["hasMxRecords"] = len(list(mx_records)) > 0
+            quality["hasMxRecords"] = self.mx_lookup(email_domain)
         except:
             quality["hasMxRecords"] = False
         
@@ -236,7 +321,137 @@ class LeadQualifier:
         self.results["qualificationLevel"] = level
 
 
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+CSV_OUTPUT_FIELDS = [
+    "email", "domain", "leadScore", "qualificationLevel", "companySize", "industry",
+    "domainAuthority", "hasMxRecords", "isFreeEmail", "flags", "error",
+]
+
+
+def _email_domain(row: Dict) -> Optional[str]:
+    email = str(row.get('email', '') or '').lower().strip()
+    if not EMAIL_PATTERN.match(email):
+        return None
+    return email.split('@')[1]
+
+
+def _read_rows(stream, fmt: str) -> Iterator[Dict]:
+    """Lazily yield input rows; malformed NDJSON lines become error rows"""
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield row
+        return
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            yield {"_error": f"Invalid JSON input on line {line_number}"}
+            continue
+        yield row if isinstance(row, dict) else {"_error": f"Expected an object on line {line_number}"}
+
+
+class _ResultWriter:
+    def __init__(self, stream, fmt: str):
+        self.stream = stream
+        self.fmt = fmt
+        if fmt == "csv":
+            self.writer = csv.DictWriter(stream, fieldnames=CSV_OUTPUT_FIELDS, extrasaction='ignore')
+            self.writer.writeheader()
+    
+    def write(self, row: Dict, result: Dict):
+        if self.fmt == "csv":
+            quality = result.get("emailQuality", {})
+            self.writer.writerow({
+                "email": row.get("email", ""),
+                "domain": row.get("domain", ""),
+                "leadScore": result.get("leadScore", ""),
+                "qualificationLevel": result.get("qualificationLevel", ""),
+                "companySize": result.get("companySize", ""),
+                "industry": result.get("industry", ""),
+                "domainAuthority": result.get("domainAuthority", ""),
+                "hasMxRecords": quality.get("hasMxRecords", ""),
+                "isFreeEmail": quality.get("isFreeEmail", ""),
+                "flags": "; ".join(result.get("flags", [])),
+                "error": result.get("error", ""),
+            })
+        else:
+            self.stream.write(json.dumps({"email": row.get("email"), "domain": row.get("domain"), **result}) + "\n")
+
+
+def qualify_bulk(rows: Iterator[Dict], writer: _ResultWriter, concurrency: int = 16, window: int = 1000) -> Dict:
+    """
+    Stream rows through LeadQualifier in input order.
+    MX lookups for upcoming rows are started while earlier rows are written,
+    at most `concurrency` at a time, and at most `window` rows are held in memory.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mx") as executor:
+        mx_cache = MXCache(executor)
+        pending: deque = deque()
+        processed = 0
+        
+        def flush_one():
+            row = pending.popleft()
+            if "_error" in row:
+                writer.write({}, {"error": row["_error"]})
+                return
+            try:
+                result = LeadQualifier(row, mx_lookup=mx_cache.has_mx).qualify()
+            except Exception as e:
+                # One bad row must not end the stream
+                result = {"error": str(e)}
+            writer.write(row, result)
+        
+        for row in rows:
+            email_domain = _email_domain(row) if "_error" not in row else None
+            if email_domain:
+                mx_cache.prefetch(email_domain)
+            pending.append(row)
+            if len(pending) >= window:
+                flush_one()
+                processed += 1
+        
+        while pending:
+            flush_one()
+            processed += 1
+        
+        return {"rows": processed, "mx_lookups": mx_cache.stats["lookups"], "mx_cache_hits": mx_cache.stats["hits"]}
+
+
+def bulk_main(argv):
+    parser = argparse.ArgumentParser(prog="lead_qualifier.py --bulk", description="Bulk lead qualification")
+    parser.add_argument("--input", help="CSV/NDJSON file (default: stdin)")
+    parser.add_argument("--output", help="Output file (default: stdout)")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Input format (default: from extension, else ndjson)")
+    parser.add_argument("--output-format", choices=["csv", "ndjson"], help="Output format (default: same as input)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent MX lookups")
+    args = parser.parse_args(argv)
+    
+    input_format = args.format or ("csv" if (args.input or "").endswith(".csv") else "ndjson")
+    output_format = args.output_format or input_format
+    
+    source = open(args.input, newline='', encoding='utf-8') if args.input else sys.stdin
+    target = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+    try:
+        summary = qualify_bulk(_read_rows(source, input_format), _ResultWriter(target, output_format), args.concurrency)
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            target.close()
+    
+    # Summary on stderr so stdout stays a clean data stream
+    print(json.dumps(summary), file=sys.stderr)
+
+
 def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "--bulk":
+        bulk_main(sys.argv[2:])
+        return
+    
     if len(sys.argv) < 2:
         print(json.dumps({
             "error": "Usage: python lead_qualifier.py '{\"email\": \"...\", \"domain\": \"...\", ...}'"
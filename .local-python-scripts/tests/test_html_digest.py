@@ -0,0 +1,52 @@
+"""
+html_digest: every installed backend gives the same digest
+
+Run from .local-python-scripts:
+    python -m pytest -q tests
+"""
+
+import pytest
+
+from arco_shared.html_digest import BACKENDS, digest_html
+
+FIXTURE = """<!DOCTYPE html>
+<html>
+<head>
+  <title>Parity &amp; fixture</title>
+  <meta name="description" content="First description">
+  <meta property="og:title" content="OG title">
+  <meta name="description" content="Second description">
+  <script>var markup = "<p>not a paragraph</p>";</script>
+  <style>p { color: red }</style>
+  <noscript><link rel="stylesheet" href="/no-js.css"></noscript>
+</head>
+<body>
+  <h1>Heading</h1>
+  <noscript><img src="/pixel.gif"><a href="/enable-js">Enable <b>JavaScript</b></a><p>Fallback</p></noscript>
+  <p>Visible <b>text</b> and <a href="/more">a link</a>.</p>
+  <h2>Sub</h2>
+  <img src="/photo.png" alt="photo">
+</body>
+</html>
+"""
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_backends_agree_on_one_fixture(backend):
+    reference = digest_html(FIXTURE, backend="html.parser")
+    digest = digest_html(FIXTURE, backend=backend)
+
+    assert digest.title == reference.title == "Parity & fixture"
+    assert digest.meta == reference.meta
+    assert digest.headings() == reference.headings()
+    for tag in ("p", "img", "a", "b", "noscript", "script", "meta"):
+        assert digest.count(tag) == reference.count(tag), tag
+    assert " ".join(digest.text.split()) == " ".join(reference.text.split())
+
+
+def test_noscript_text_is_invisible():
+    for backend in BACKENDS:
+        text = digest_html(FIXTURE, backend=backend).text
+        assert "Visible text" in " ".join(text.split()), backend
+        assert "Enable" not in text and "Fallback" not in text, backend
+        assert "not a paragraph" not in text, backend
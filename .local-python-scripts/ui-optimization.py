@@ -8,12 +8,17 @@ import os
 from pathlib import Path
 import re
 
+from arco_shared.source_scan import get_scan_cache
+
+# Raiz do projeto (este script fica em .local-python-scripts/), independente do diretório atual
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 def analyze_ui_components():
     """Analisa componentes UI para identificar qualidade e otimização"""
     print("🎨 ANÁLISE DE COMPONENTES UI/UX")
     print("=" * 40)
     
-    src = Path("src")
+    src = PROJECT_ROOT / "src"
     ui_locations = {
         'design-system': [],
         'components/ui': [],
@@ -55,52 +60,52 @@ def analyze_ui_components():
 def analyze_component_quality(file_path):
     """Analisa qualidade de um componente"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Métricas em cache; o arquivo só é reprocessado se o conteúdo mudou
+        metrics = get_scan_cache(PROJECT_ROOT).scan(file_path)
+        flags = metrics['features']
         
         quality_score = 0
         features = []
         
         # Check for modern React patterns
-        if 'forwardRef' in content:
+        if flags['forward_ref']:
             quality_score += 10
             features.append("forwardRef")
         
-        if 'useMemo' in content or 'useCallback' in content:
+        if flags['performance_hooks']:
             quality_score += 15
             features.append("performance hooks")
         
         # Check for TypeScript
-        if ': React.' in content or 'interface ' in content or 'type ' in content:
+        if flags['typescript']:
             quality_score += 20
             features.append("TypeScript")
         
         # Check for accessibility
-        if 'aria-' in content or 'role=' in content:
+        if flags['accessibility']:
             quality_score += 15
             features.append("accessibility")
         
         # Check for styling approach
-        if 'className' in content:
+        if flags['class_names']:
             quality_score += 10
             features.append("Tailwind/CSS")
         
         # Check for animations
-        if 'framer-motion' in content or 'motion.' in content:
+        if flags['animations']:
             quality_score += 10
             features.append("animations")
         
         # Check for reusability
-        if 'Props' in content and 'export' in content:
+        if flags['reusable']:
             quality_score += 15
             features.append("reusable")
         
         # Check for complexity (negative for overly complex)
-        lines = content.split('\n')
-        if len(lines) > 200:
+        if metrics['total_lines'] > 200:
             quality_score -= 10
             features.append("complex")
-        elif len(lines) < 50:
+        elif metrics['total_lines'] < 50:
             quality_score += 5
             features.append("clean")
         
@@ -115,6 +120,8 @@ def identify_high_quality_components():
     print("-" * 35)
     
     ui_locations = analyze_ui_components()
+    # Lê/processa de uma vez (em paralelo) só os arquivos alterados; o loop abaixo usa o cache
+    get_scan_cache(PROJECT_ROOT).scan_many(comp_path for components in ui_locations.values() for _, comp_path in components)
     high_quality = []
     medium_quality = []
     low_quality = []
@@ -216,7 +223,7 @@ export * from './hooks';
 export * from './foundations';
 '''
     
-    ds_index_path = Path("src/design-system/index.ts")
+    ds_index_path = PROJECT_ROOT / "src" / "design-system" / "index.ts"
     with open(ds_index_path, 'w', encoding='utf-8') as f:
         f.write(ds_index_content)
     
@@ -238,7 +245,7 @@ export * from './ui';
 export * from './partner';
 '''
     
-    ui_index_path = Path("src/components/index.ts")
+    ui_index_path = PROJECT_ROOT / "src" / "components" / "index.ts"
     with open(ui_index_path, 'w', encoding='utf-8') as f:
         f.write(ui_index_content)
     
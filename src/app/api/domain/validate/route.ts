@@ -1,7 +1,7 @@
 import { NextRequest } from 'next/server'
 import { z } from 'zod'
-import { spawn } from 'child_process'
 import { createSupabaseAdmin } from '@/lib/supabase/server'
+import { getDomainValidatorPool } from '@/lib/services/domain-validator-pool'
 import {
   successResponse,
   validationErrorResponse,
@@ -70,68 +70,33 @@ function checkRateLimit(ip: string): boolean {
 }
 
 /**
- * Execute Python domain validator script
+ * Run the Python domain validator on the warm worker pool
  * Returns REAL domain validation data (NO MOCKS)
  */
 async function validateDomainWithPython(domain: string): Promise<DomainValidationResult> {
-  return new Promise((resolve, reject) => {
-    // Use Python from virtual environment if available
-    const pythonPath = process.env.PYTHON_PATH || '.venv/bin/python3'
-    const pythonProcess = spawn(pythonPath, [
-      'scripts/domain_validator.py',
-      domain
-    ])
+  // Persistent workers: no interpreter startup or import cost per request
+  const result = (await getDomainValidatorPool().validate(domain, 30000)) as any
 
-    let output = ''
-    let errorOutput = ''
-
-    pythonProcess.stdout.on('data', (data) => {
-      output += data.toString()
-    })
-
-    pythonProcess.stderr.on('data', (data) => {
-      errorOutput += data.toString()
-    })
-
-    pythonProcess.on('close', (code) => {
-      if (code !== 0) {
-        console.error('[Domain Validator] Python script error:', errorOutput)
-        reject(new Error(`Python script exited with code ${code}: ${errorOutput}`))
-        return
-      }
-
-      try {
-        const result = JSON.parse(output)
-        
-        // Transform Python output to API format
-        const validationResult: DomainValidationResult = {
-          domain: result.domain,
-          isValid: result.isValid,
-          isAvailable: result.isAvailable,
-          dnsRecords: {
-            a: result.dnsRecords.a || [],
-            mx: result.dnsRecords.mx || [],
-            txt: result.dnsRecords.txt || []
-          },
-          sslValid: result.sslValid,
-          suggestions: result.suggestions || [],
-          cachedUntil: new Date(Date.now() + 60 * 60 * 1000).toISOString(), // Cache for 1 hour
-          performanceScore: result.performanceScore
-        }
-
-        resolve(validationResult)
-      } catch (error) {
-        console.error('[Domain Validator] Failed to parse Python output:', output)
-        reject(new Error('Failed to parse validation results'))
-      }
-    })
+  if (!result || !result.dnsRecords) {
+    console.error('[Domain Validator] Unexpected worker output:', result)
+    throw new Error('Failed to parse validation results')
+  }
 
-    // Timeout after 30 seconds
-    setTimeout(() => {
-      pythonProcess.kill()
-      reject(new Error('Domain validation timeout (30s)'))
-    }, 30000)
-  })
+  // Transform Python output to API format
+  return {
+    domain: result.domain,
+    isValid: result.isValid,
+    isAvailable: result.isAvailable,
+    dnsRecords: {
+      a: result.dnsRecords.a || [],
+      mx: result.dnsRecords.mx || [],
+      txt: result.dnsRecords.txt || []
+    },
+    sslValid: result.sslValid,
+    suggestions: result.suggestions || [],
+    cachedUntil: new Date(Date.now() + 60 * 60 * 1000).toISOString(), // Cache for 1 hour
+    performanceScore: result.performanceScore
+  }
 }
 
 /**
@@ -0,0 +1,230 @@
+/**
+ * Domain Validator Worker Pool
+ *
+ * Keeps long-lived `domain_validator.py --serve` processes warm so a
+ * validation costs only network time, not interpreter startup plus the
+ * dns/whois/requests imports on every request.
+ *
+ * Protocol (JSON lines over stdin/stdout):
+ *   -> {"id": "1", "domain": "example.com"}
+ *   <- {"id": "1", "result": {...}} | {"id": "1", "error": "..."}
+ *
+ * Env:
+ *   PYTHON_PATH                  interpreter (default .venv/bin/python3)
+ *   DOMAIN_VALIDATOR_SCRIPT      script path (default scripts/domain_validator.py)
+ *   DOMAIN_VALIDATOR_POOL_SIZE   worker processes (default 1)
+ *   DOMAIN_VALIDATOR_THREADS     concurrent validations per process (default 8)
+ *   DOMAIN_VALIDATOR_WARM        "true" spawns the pool at module load
+ */
+
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process'
+import { createInterface } from 'readline'
+
+interface PendingRequest {
+  resolve: (result: unknown) => void
+  reject: (error: Error) => void
+  timer: ReturnType<typeof setTimeout>
+}
+
+interface WorkerMessage {
+  id: string | null
+  ready?: boolean
+  result?: unknown
+  error?: string
+}
+
+class ValidatorWorker {
+  private readonly process: ChildProcessWithoutNullStreams
+  private readonly pending = new Map<string, PendingRequest>()
+  private nextId = 0
+  private stderrTail = ''
+  alive = true
+  readonly ready: Promise<void>
+
+  constructor(pythonPath: string, scriptPath: string, threads: number) {
+    this.process = spawn(pythonPath, [scriptPath, '--serve', '--workers', String(threads)])
+
+    let markReady: () => void = () => {}
+    let failReady: (error: Error) => void = () => {}
+    this.ready = new Promise<void>((resolve, reject) => {
+      markReady = resolve
+      failReady = reject
+    })
+    // Avoid unhandled rejections when nobody is waiting on readiness
+    this.ready.catch(() => {})
+
+    createInterface({ input: this.process.stdout }).on('line', (line) => {
+      let message: WorkerMessage
+      try {
+        message = JSON.parse(line)
+      } catch {
+        return // Stray library output, not a protocol message
+      }
+
+      if (message.ready) {
+        markReady()
+        return
+      }
+      if (message.id === null) {
+        return
+      }
+
+      const request = this.pending.get(message.id)
+      if (!request) {
+        return // Already timed out
+      }
+      this.pending.delete(message.id)
+      clearTimeout(request.timer)
+
+      if (message.error) {
+        request.reject(new Error(message.error))
+      } else {
+        request.resolve(message.result)
+      }
+    })
+
+    this.process.stderr.on('data', (data) => {
+      this.stderrTail = (this.stderrTail + data.toString()).slice(-2000)
+    })
+
+    const onExit = (reason: string) => {
+      if (!this.alive) return
+      this.alive = false
+      const error = new Error(`Domain validator worker ${reason}: ${this.stderrTail}`)
+      console.error('[Domain Validator] Worker stopped:', error.message)
+      failReady(error)
+      for (const request of this.pending.values()) {
+        clearTimeout(request.timer)
+        request.reject(error)
+      }
+      this.pending.clear()
+    }
+
+    this.process.on('exit', (code) => onExit(`exited with code ${code}`))
+    this.process.on('error', (error) => onExit(`failed to start (${error.message})`))
+    // EPIPE when the worker dies between the alive check and a write. A child that
+    // is still up with a broken stdin can never be written to again: retire it
+    // (workerAt() respawns on the next request) and make sure it is gone.
+    this.process.stdin.on('error', (error) => {
+      onExit(`stdin closed (${error.message})`)
+      this.process.kill()
+    })
+  }
+
+  get load(): number {
+    return this.pending.size
+  }
+
+  validate(domain: string, timeoutMs: number): Promise<unknown> {
+    const id = String(++this.nextId)
+
+    return new Promise((resolve, reject) => {
+      if (!this.alive) {
+        reject(new Error('Domain validator worker is not running'))
+        return
+      }
+      const timer = setTimeout(() => {
+        this.pending.delete(id)
+        reject(new Error(`Domain validation timeout (${timeoutMs / 1000}s)`))
+      }, timeoutMs)
+
+      this.pending.set(id, { resolve, reject, timer })
+      this.process.stdin.write(JSON.stringify({ id, domain }) + '\n')
+    })
+  }
+
+  kill(): void {
+    this.process.kill()
+  }
+}
+
+export class DomainValidatorPool {
+  private readonly workers: (ValidatorWorker | null)[]
+
+  constructor(
+    private readonly size: number,
+    private readonly pythonPath: string,
+    private readonly scriptPath: string,
+    private readonly threads: number
+  ) {
+    this.workers = Array.from({ length: Math.max(1, size) }, () => null)
+  }
+
+  /**
+   * Spawn every worker now instead of on first use
+   */
+  warm(): void {
+    for (let i = 0; i < this.workers.length; i++) {
+      this.workerAt(i)
+    }
+  }
+
+  /**
+   * Validate on the least busy worker, respawning dead ones
+   */
+  async validate(domain: string, timeoutMs = 30000): Promise<unknown> {
+    const startedAt = Date.now()
+    let chosen = this.workerAt(0)
+    for (let i = 1; i < this.workers.length; i++) {
+      const worker = this.workerAt(i)
+      if (worker.load < chosen.load) {
+        chosen = worker
+      }
+    }
+
+    // The timeout covers start-up too: a worker that never reports ready
+    // is killed (and respawned by the next request) instead of hanging this one
+    let timer: ReturnType<typeof setTimeout> | undefined
+    const notReady = new Promise<never>((_, reject) => {
+      timer = setTimeout(() => {
+        chosen.kill()
+        reject(new Error(`Domain validation timeout (${timeoutMs / 1000}s): worker not ready`))
+      }, timeoutMs)
+    })
+    try {
+      await Promise.race([chosen.ready, notReady])
+    } finally {
+      clearTimeout(timer)
+    }
+
+    return chosen.validate(domain, Math.max(1, timeoutMs - (Date.now() - startedAt)))
+  }
+
+  shutdown(): void {
+    for (const worker of this.workers) {
+      worker?.kill()
+    }
+    this.workers.fill(null)
+  }
+
+  private workerAt(index: number): ValidatorWorker {
+    const current = this.workers[index]
+    if (current && current.alive) {
+      return current
+    }
+    const worker = new ValidatorWorker(this.pythonPath, this.scriptPath, this.threads)
+    this.workers[index] = worker
+    return worker
+  }
+}
+
+// Survive Next.js dev hot reloads without leaking processes
+const globalForValidator = globalThis as unknown as {
+  domainValidatorPool?: DomainValidatorPool
+}
+
+export function getDomainValidatorPool(): DomainValidatorPool {
+  if (!globalForValidator.domainValidatorPool) {
+    globalForValidator.domainValidatorPool = new DomainValidatorPool(
+      Number(process.env.DOMAIN_VALIDATOR_POOL_SIZE || 1),
+      process.env.PYTHON_PATH || '.venv/bin/python3',
+      process.env.DOMAIN_VALIDATOR_SCRIPT || 'scripts/domain_validator.py',
+      Number(process.env.DOMAIN_VALIDATOR_THREADS || 8)
+    )
+  }
+  return globalForValidator.domainValidatorPool
+}
+
+if (process.env.DOMAIN_VALIDATOR_WARM === 'true') {
+  getDomainValidatorPool().warm()
+}